@@ -30,6 +30,14 @@ class DebridCache(BaseCache):
 			self.dbcur.executemany(SET_MANY, insert_list)
 		except: pass
 
+	def set_many_multi(self, insert_list):
+		# one executemany for rows spanning several debrids
+		try:
+			expires = self._get_timestamp(datetime.now() + timedelta(hours=24))
+			insert_list = [(i[0], i[1], i[2], expires) for i in insert_list]
+			self.dbcur.executemany(SET_MANY, insert_list)
+		except: pass
+
 	def remove_many(self, old_cached_data):
 		try:
 			old_cached_data = [(str(i[0]),) for i in old_cached_data]
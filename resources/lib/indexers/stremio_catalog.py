@@ -7,14 +7,61 @@
 	- Integration with POV metadata system
 """
 
+import re
 import json
+import hashlib
 import requests
-from threading import Thread
+from requests.adapters import HTTPAdapter
+from threading import Thread, Semaphore
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from urllib.parse import quote_plus, urlparse
+from caches.main_cache import MainCache
+try: from orjson import loads as _loads
+except ImportError:
+	try: from ujson import loads as _loads
+	except ImportError: from json import loads as _loads
 from modules.kodi_utils import (
 	get_setting, notification, make_listitem, add_items,
 	set_content, end_directory, set_view_mode, build_url
 )
 
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+session.headers.update({'User-Agent': 'POV-Kodi/1.0'})
+
+# cap concurrency per addon host so parallel fetches cannot trip rate limits
+_HOST_SEM = defaultdict(lambda: Semaphore(4))
+
+def _host_get(url, **kwargs):
+	with _HOST_SEM[urlparse(url).netloc]:
+		return session.get(url, **kwargs)
+
+_TT_RE = re.compile(r'(tt\d+)')
+
+_META_FIELDS = ('name', 'id', 'year', 'poster', 'background', 'fanart', 'logo', 'description', 'genres', 'imdb_id')
+_BASE_MOVIE = build_url({'mode': 'extras_menu_choice', 'media_type': 'movie'})
+_BASE_TVSHOW = build_url({'mode': 'extras_menu_choice', 'media_type': 'tvshow'})
+
+@lru_cache(maxsize=64)
+def _base(addon_url):
+	b = addon_url.rstrip('/')
+	return b[:-14] if b.endswith('/manifest.json') else b
+
+@lru_cache(maxsize=4)
+def _parse_addons(addons_str):
+	if not addons_str: return ()
+	try:
+		addons = json.loads(addons_str)
+	except ValueError:
+		import ast
+		addons = ast.literal_eval(addons_str)
+	return tuple(addons) if isinstance(addons, list) else ()
+
 
 class StremioIndexer:
 	"""Indexer for browsing Stremio addon catalogs"""
@@ -40,43 +87,55 @@ class StremioIndexer:
 	def get_stremio_addons(self):
 		"""Get list of configured Stremio addons"""
 		try:
-			import ast
-			addons_str = get_setting('stremio.addons', '')
-			if addons_str:
-				addons = ast.literal_eval(addons_str)
-				return addons if isinstance(addons, list) else []
+			return list(_parse_addons(get_setting('stremio.addons', '')))
 		except:
 			pass
 		return []
 
 	def fetch_manifest(self, addon_url):
-		"""Fetch addon manifest"""
+		"""Fetch addon manifest, cached for 24 hours"""
 		try:
+			cache_name = 'stremio_manifest_%s' % hashlib.md5(addon_url.encode()).hexdigest()
+			maincache = MainCache()
+			cache = maincache.get(cache_name)
+			if cache: return cache
+
 			base_url = addon_url.rstrip('/')
 			if base_url.endswith('/manifest.json'):
 				manifest_url = base_url
 			else:
 				manifest_url = f"{base_url}/manifest.json"
 
-			response = requests.get(
-				manifest_url,
-				timeout=10,
-				headers={'User-Agent': 'POV-Kodi/1.0'}
-			)
+			response = _host_get(manifest_url, timeout=10)
 
 			if response.status_code == 200:
-				return response.json()
+				manifest = response.json()
+				if manifest: maincache.set(cache_name, manifest, expiration=timedelta(hours=24))
+				return manifest
 		except:
 			pass
 		return None
 
+	def _fetch_all_manifests(self, urls):
+		"""Fetch manifests for multiple addons in parallel"""
+		if not urls:
+			return []
+		with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+			return list(executor.map(self.fetch_manifest, urls))
+
 	def list_addons_with_catalogs(self):
 		"""List all addons that have catalog support"""
 		addons = self.get_stremio_addons()
+		urls = [addon.get('config_url', '') or addon.get('url', '') for addon in addons]
+		manifests = self._fetch_all_manifests(urls)
 		items = []
 
-		for addon in addons:
-			if addon.get('supports_catalog', False):
+		for addon, manifest in zip(addons, manifests):
+			if manifest is not None:
+				supports_catalog = bool(manifest.get('catalogs'))
+			else:
+				supports_catalog = addon.get('supports_catalog', False)
+			if supports_catalog:
 				addon_url = addon.get('config_url', '') or addon.get('url', '')
 				items.append({
 					'name': addon.get('name', 'Unknown'),
@@ -95,8 +154,6 @@ class StremioIndexer:
 
 	def _build_addon_list(self, items):
 		"""Build Kodi list of addons"""
-		from modules.kodi_utils import build_url, make_listitem, add_items
-
 		listitems = []
 		for item in items:
 			listitem = make_listitem()
@@ -159,8 +216,6 @@ class StremioIndexer:
 
 	def _build_catalog_list(self, items):
 		"""Build Kodi list of catalogs"""
-		from modules.kodi_utils import build_url, make_listitem, add_items
-
 		listitems = []
 		for item in items:
 			listitem = make_listitem()
@@ -199,14 +254,22 @@ class StremioIndexer:
 			notification('No items found', 2000)
 			return
 
+		# Warm the next page cache while the user reads this one
+		if len(metas) >= 20:
+			Thread(target=self.fetch_catalog, args=(addon_url, catalog_type, catalog_id, skip + len(metas))).start()
+
 		self._build_meta_list(metas, addon_url, catalog_type, catalog_id, skip)
 
 	def fetch_catalog(self, addon_url, catalog_type, catalog_id, skip=0):
-		"""Fetch catalog contents from addon"""
+		"""Fetch catalog contents from addon, cached for 10 minutes"""
 		try:
-			base_url = addon_url.rstrip('/')
-			if base_url.endswith('/manifest.json'):
-				base_url = base_url[:-14]
+			cache_key = '%s_%s_%s_%s' % (addon_url, catalog_type, catalog_id, skip)
+			cache_name = 'stremio_catalog_%s' % hashlib.md5(cache_key.encode()).hexdigest()
+			maincache = MainCache()
+			cache = maincache.get(cache_name)
+			if cache: return cache
+
+			base_url = _base(addon_url)
 
 			# Build catalog endpoint with skip for pagination
 			if skip > 0:
@@ -214,108 +277,87 @@ class StremioIndexer:
 			else:
 				endpoint = f"{base_url}/catalog/{catalog_type}/{catalog_id}.json"
 
-			response = requests.get(
-				endpoint,
-				timeout=15,
-				headers={'User-Agent': 'POV-Kodi/1.0'}
-			)
+			response = _host_get(endpoint, timeout=15)
 
 			if response.status_code == 200:
-				data = response.json()
-				return data.get('metas', [])
+				data = _loads(response.content)
+				# Project to the fields the listitem builder uses, dropping
+				# heavy unused payload (videos, trailers, behaviorHints)
+				metas = [{k: m[k] for k in _META_FIELDS if m.get(k)} for m in data.get('metas', [])]
+				if metas: maincache.set(cache_name, metas, expiration=timedelta(minutes=10))
+				return metas
 		except:
 			pass
 		return []
 
 	def _build_meta_list(self, metas, addon_url, catalog_type, catalog_id, current_skip):
 		"""Build Kodi list of meta items"""
-		from modules.kodi_utils import build_url, make_listitem, add_items
-
-		listitems = []
-
-		for meta in metas:
-			listitem = make_listitem()
-
-			name = meta.get('name', 'Unknown')
-			year = meta.get('year', '')
-			imdb_id = meta.get('imdb_id', '') or meta.get('id', '')
+		is_movie = catalog_type == 'movie'
+		folder = not is_movie
+		base_play = _BASE_MOVIE if is_movie else _BASE_TVSHOW
+		base_meta = build_url({
+			'mode': 'stremio_catalog', 'stremio_mode': 'view_meta',
+			'addon_url': addon_url, 'meta_type': catalog_type
+		})
+
+		def _prepare_meta(meta):
+			# pure Python marshaling, safe off the UI thread
+			g = meta.get
+
+			name = g('name', 'Unknown')
+			year = g('year', '')
+			imdb_id = g('imdb_id', '') or g('id', '')
 
 			# Extract IMDb ID from id if needed
-			if imdb_id.startswith('tt'):
-				pass
-			elif ':' in imdb_id:
-				imdb_id = imdb_id.split(':')[0]
+			m = _TT_RE.match(imdb_id)
+			imdb_id = m.group(1) if m else imdb_id.split(':', 1)[0]
 
 			# Set label
 			if year:
-				listitem.setLabel(f"{name} ({year})")
+				label = f"{name} ({year})"
 			else:
-				listitem.setLabel(name)
+				label = name
 
 			# Set info
+			year_i = int(year) if isinstance(year, str) and year.isdigit() else (year or 0) if isinstance(year, int) else 0
 			info_dict = {
 				'title': name,
-				'year': int(year) if year and year.isdigit() else 0,
-				'plot': meta.get('description', ''),
-				'genre': ', '.join(meta.get('genres', [])) if meta.get('genres') else '',
+				'year': year_i,
+				'plot': g('description', ''),
+				'genre': ', '.join(g('genres', [])) if g('genres') else '',
 				'imdbnumber': imdb_id
 			}
-			listitem.setInfo('video', info_dict)
 
 			# Set art
-			poster = meta.get('poster', '')
-			background = meta.get('background', '') or meta.get('fanart', '')
-			logo = meta.get('logo', '')
-
-			art_dict = {}
-			if poster:
-				art_dict['poster'] = poster
-				art_dict['thumb'] = poster
-			if background:
-				art_dict['fanart'] = background
-			if logo:
-				art_dict['clearlogo'] = logo
+			poster = g('poster', '')
+			background = g('background', '') or g('fanart', '')
+			logo = g('logo', '')
+
+			art_dict = {k: v for k, v in (
+				('poster', poster), ('thumb', poster), ('fanart', background), ('clearlogo', logo)
+			) if v}
 
+			# Link to POV's info when we have an IMDb id, else addon meta view
+			if imdb_id.startswith('tt'):
+				url = f"{base_play}&imdb_id={imdb_id}&name={quote_plus(name)}"
+			else:
+				url = f"{base_meta}&meta_id={quote_plus(g('id', ''))}"
+
+			return (label, info_dict, art_dict, url)
+
+		def _materialize(prep):
+			# xbmcgui construction stays on the invoking thread
+			label, info_dict, art_dict, url = prep
+			listitem = make_listitem()
+			listitem.setLabel(label)
+			listitem.setInfo('video', info_dict)
 			if art_dict:
 				listitem.setArt(art_dict)
+			return (url, listitem, folder)
 
-			# Determine action based on type
-			if catalog_type == 'movie':
-				# Link to POV's movie play/info
-				if imdb_id.startswith('tt'):
-					url = build_url({
-						'mode': 'extras_menu_choice',
-						'media_type': 'movie',
-						'imdb_id': imdb_id,
-						'name': name
-					})
-				else:
-					url = build_url({
-						'mode': 'stremio_catalog',
-						'stremio_mode': 'view_meta',
-						'addon_url': addon_url,
-						'meta_type': catalog_type,
-						'meta_id': meta.get('id', '')
-					})
-			else:
-				# Series - link to POV's show info
-				if imdb_id.startswith('tt'):
-					url = build_url({
-						'mode': 'extras_menu_choice',
-						'media_type': 'tvshow',
-						'imdb_id': imdb_id,
-						'name': name
-					})
-				else:
-					url = build_url({
-						'mode': 'stremio_catalog',
-						'stremio_mode': 'view_meta',
-						'addon_url': addon_url,
-						'meta_type': catalog_type,
-						'meta_id': meta.get('id', '')
-					})
-
-			listitems.append((url, listitem, catalog_type == 'series'))
+		with ThreadPoolExecutor(max_workers=4) as executor:
+			preps = list(executor.map(_prepare_meta, metas))
+		listitems = [_materialize(prep) for prep in preps]
 
 		# Add "Next Page" item if we got a full page
 		if len(metas) >= 20:  # Assuming 20 items per page
@@ -363,20 +405,12 @@ class StremioIndexer:
 	def fetch_meta(self, addon_url, meta_type, meta_id):
 		"""Fetch detailed metadata for an item"""
 		try:
-			base_url = addon_url.rstrip('/')
-			if base_url.endswith('/manifest.json'):
-				base_url = base_url[:-14]
-
-			endpoint = f"{base_url}/meta/{meta_type}/{meta_id}.json"
+			endpoint = f"{_base(addon_url)}/meta/{meta_type}/{meta_id}.json"
 
-			response = requests.get(
-				endpoint,
-				timeout=10,
-				headers={'User-Agent': 'POV-Kodi/1.0'}
-			)
+			response = _host_get(endpoint, timeout=10)
 
 			if response.status_code == 200:
-				data = response.json()
+				data = _loads(response.content)
 				return data.get('meta', {})
 		except:
 			pass
@@ -1,22 +1,33 @@
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import timedelta
 from caches.main_cache import MainCache
 from modules.kodi_utils import notification, sleep
 # from modules.kodi_utils import logger
+try: from orjson import loads as _loads
+except ImportError:
+	try: from ujson import loads as _loads
+	except ImportError: from json import loads as _loads
 
 search_url = 'https://sub.wyzie.ru/search'
 timeout = 5.05
 
-def _get(url, params=None, stream=False, retry=False):
-	response = requests.get(url, params=params, stream=stream, timeout=timeout)
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+session.headers.update({'Accept-Encoding': 'gzip'})
+
+def _get(url, params=None, retry=False):
+	response = session.get(url, params=params, timeout=timeout)
 	if retry and response.status_code in (403, 429):
 		notification(32740)
 		sleep(10000)
-		return _get(url, params=params, stream=stream)
+		return _get(url, params=params)
 	return response
 
 def download(url):
-	response = _get(url, stream=True, retry=True)
+	response = _get(url, retry=True)
 	return response if response.ok else response.reason
 
 def search(imdb_id, season=None, episode=None):
@@ -30,7 +41,7 @@ def search(imdb_id, season=None, episode=None):
 	if cache: return cache
 	response = _get(search_url, params=params, retry=True)
 	if not response.ok: return []
-	response = response.json()
+	response = _loads(response.content)
 	if response: maincache.set(cache_name, response, expiration=timedelta(hours=24))
 	return response
 
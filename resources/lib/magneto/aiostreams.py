@@ -15,10 +15,28 @@
 	3. Provide their own user data configuration from the AIOStreams configure page
 """
 
+import re
 import requests
+from functools import lru_cache
+from threading import Semaphore
+from requests.adapters import HTTPAdapter
 from fenom import source_utils
 from fenom.control import setting as getSetting
 
+# module-level so the pool (and its TLS sockets) outlives each scraper run;
+# aiostreams talks to a single configured host, so few pools with headroom
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
+# cap concurrent hits against the configured instance to avoid rate limits
+_HOST_SEM = Semaphore(4)
+
+_TITLE_SUB = re.compile(r'Special Victims Unit|[&/]')
+_TITLE_MAP = {'Special Victims Unit': 'SVU', '&': 'and', '/': ' '}
+def _title_norm(title): return _TITLE_SUB.sub(lambda m: _TITLE_MAP[m.group(0)], title)
+
 
 # Pre-configured public instances
 PUBLIC_INSTANCES = (
@@ -68,6 +86,7 @@ class source:
 		self.movieSearch_link = '/api/v1/search'
 		self.tvSearch_link = '/api/v1/search'
 		self.min_seeders = 0
+		self.headers = {'x-aiostreams-user-data': self._get_user_data()}
 
 	def _get_base_url(self):
 		"""
@@ -104,7 +123,7 @@ class source:
 		sources_append = sources.append
 		try:
 			title = data['tvshowtitle'] if 'tvshowtitle' in data else data['title']
-			title = title.replace('&', 'and').replace('Special Victims Unit', 'SVU').replace('/', ' ')
+			title = _title_norm(title)
 			aliases = data['aliases']
 			episode_title = data['title'] if 'tvshowtitle' in data else None
 			total_seasons = data['total_seasons'] if 'tvshowtitle' in data else None
@@ -122,7 +141,7 @@ class source:
 				params = {'type': 'movie', 'id': '%s' % imdb}
 			# log_utils.log('url = %s' % url)
 			if 'timeout' in data: self.timeout = int(data['timeout'])
-			results = requests.get(url, params=params, headers=self._headers(), timeout=self.timeout)
+			with _HOST_SEM: results = session.get(url, params=params, headers=self.headers, timeout=self.timeout)
 			response = results.json()
 			# Handle API response format: {"success": bool, "data": {"results": [...], "errors": [...]}}
 			if not response.get('success', True):
@@ -132,15 +151,17 @@ class source:
 			files = response.get('data', {}).get('results', [])
 			undesirables = source_utils.get_undesirables()
 			check_foreign_audio = source_utils.check_foreign_audio()
+			# only name varies per file; collapse repeated parses of quality variants
+			@lru_cache(maxsize=512)
+			def _info(n): return source_utils.info_from_name(n, title, year, hdlr, episode_title)
 		except:
 			source_utils.scraper_error('AIOSTREAMS')
 			return sources
 
-		for file in files:
-			try:
+		try:
+			for file in (f for f in files if f.get('infoHash')):
 				package, episode_start = None, 0
-				hash = file.get('infoHash')
-				if not hash: continue  # Skip results without infoHash
+				hash = file['infoHash']
 
 				# Get filename from various possible fields
 				file_title = file.get('folderName') or file.get('filename') or file.get('name', '')
@@ -156,28 +177,22 @@ class source:
 						if not valid: continue
 						else: package = 'season'
 					else: package = 'show'
-				name_info = source_utils.info_from_name(name, title, year, hdlr, episode_title)
+				name_info = _info(name)
 				if source_utils.remove_lang(name_info, check_foreign_audio): continue
 				if undesirables and source_utils.remove_undesirables(name_info, undesirables): continue
 
 				url = 'magnet:?xt=urn:btih:%s&dn=%s' % (hash, name)
 
-				try:
-					seeders = file.get('seeders', 0)
-					if seeders is None: seeders = 0
-					if self.min_seeders > seeders: continue
-				except: seeders = 0
+				seeders = file.get('seeders') or 0
+				if self.min_seeders > seeders: continue
 
 				quality, info = source_utils.get_release_quality(name_info, url)
-				try:
-					size = file.get('size', 0)
-					if size:
-						size_str = f"{float(size) / 1073741824:.2f} GB"
-						dsize, isize = source_utils._size(size_str)
-						info.insert(0, isize)
-					else:
-						dsize = 0
-				except: dsize = 0
+				size = file.get('size') or 0
+				if size:
+					size_str = f"{float(size) / 1073741824:.2f} GB"
+					dsize, isize = source_utils._size(size_str)
+					info.insert(0, isize)
+				else: dsize = 0
 				info = ' | '.join(info)
 
 				item = {
@@ -189,10 +204,7 @@ class source:
 				if package == 'show': item.update({'last_season': last_season})
 				if episode_start: item.update({'episode_start': episode_start, 'episode_end': episode_end}) # for partial season packs
 				sources_append(item)
-			except:
-				source_utils.scraper_error('AIOSTREAMS')
+		except:
+			source_utils.scraper_error('AIOSTREAMS')
 		return sources
 
-	def _headers(self):
-		return {'x-aiostreams-user-data': self._get_user_data()}
-
@@ -11,20 +11,91 @@
 """
 
 import re
+import ast
 import requests
-from json import loads as jsloads
+from urllib.parse import urlparse
+try: from orjson import loads as _loads
+except ImportError:
+	try: from ujson import loads as _loads
+	except ImportError: from json import loads as _loads
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from fenom import source_utils
 from fenom.control import setting as getSetting
 
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+session.headers.update({'User-Agent': 'POV-Kodi/1.0'})
+
+# httpx multiplexes the addon fan-out over HTTP/2 when it happens to be
+# installed; the pooled requests session above stays the fallback
+try:
+	import httpx
+	_client = httpx.Client(
+		http2=True, timeout=8.0, headers={'User-Agent': 'POV-Kodi/1.0'},
+		limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+	)
+	def _http_get(url, timeout=8):
+		return _client.get(url, timeout=timeout)
+except ImportError:
+	def _http_get(url, timeout=8):
+		return session.get(url, timeout=timeout)
+
+# per-process caches so repeat sources() calls skip manifest round-trips
+_ADDON_NAME_CACHE = {}
+
+@lru_cache(maxsize=256)
+def _base_url(addon_url):
+	base_url = addon_url.rstrip('/')
+	return base_url[:-14] if base_url.endswith('/manifest.json') else base_url
+
 
 # Pre-compiled regex patterns for parsing stream metadata
 RE_SEEDERS = re.compile(r'(?:👤|seeders?[:\s]*|peers?[:\s]*)(\d+)', re.I)
 RE_SIZE = re.compile(r'((?:\d+[,.]?\d*)\s*(?:GB|GiB|MB|MiB|TB|TiB))', re.I)
-RE_QUALITY = re.compile(r'(2160p|4k|uhd|1080p|720p|480p|360p)', re.I)
-RE_CODEC = re.compile(r'(hevc|h\.?265|x265|av1|h\.?264|x264)', re.I)
-RE_HDR = re.compile(r'(hdr10\+?|dolby.?vision|dv|hlg)', re.I)
-RE_AUDIO = re.compile(r'(atmos|truehd|dts-?hd|dd[p+]?5\.1|aac|eac3)', re.I)
+RE_META = re.compile(
+	r'(?P<quality>2160p|4k|uhd|1080p|720p|480p|360p)'
+	r'|(?P<codec>hevc|h\.?265|x265|av1|h\.?264|x264)'
+	r'|(?P<hdr>hdr10\+?|dolby.?vision|dv|hlg)'
+	r'|(?P<audio>atmos|truehd|dts-?hd|dd[p+]?5\.1|aac|eac3)', re.I
+)
+_QUALITY_MAP = {'2160p': '4K', '4k': '4K', 'uhd': '4K', '1080p': '1080p', '720p': '720p', '480p': 'SD', '360p': 'SD'}
 RE_DEBRID_URL = re.compile(r'(real-?debrid|realdebrid|alldebrid|premiumize|torbox|debrid-link|easydebrid|offcloud)', re.I)
+RE_DEBRID_CONFIG = re.compile(
+	r'(realdebrid=|rd=|debridkey=|premiumize=|pm=|alldebrid=|ad=|torbox=|tb=|offcloud=|oc=|debrid-link=|dl=|easydebrid=|ed=)', re.I
+)
+
+
+class StreamInfo:
+	# slotted so the 200+ instances per scrape skip per-object dicts
+	__slots__ = (
+		'hash', 'url', 'name', 'seeders', 'size', 'size_str', 'quality', 'provider',
+		'file_idx', 'is_debrid_resolved', 'proxy_headers', 'subtitles', 'binge_group',
+		'stream_type', 'youtube_id', 'external_url', 'codec', 'hdr', 'audio'
+	)
+	def __init__(self):
+		self.hash = None
+		self.url = None
+		self.name = ''
+		self.seeders = 0
+		self.size = 0
+		self.size_str = ''
+		self.quality = 'SD'
+		self.provider = ''
+		self.file_idx = None
+		self.is_debrid_resolved = False
+		self.proxy_headers = None
+		self.subtitles = []
+		self.binge_group = None
+		self.stream_type = 'unknown'
+		self.youtube_id = None
+		self.external_url = None
+		self.codec = ''
+		self.hdr = ''
+		self.audio = ''
 
 
 class source:
@@ -40,153 +111,137 @@ class source:
 		self.addons = self._load_addons()
 		self.fetch_subtitles = getSetting('stremio.subtitles', 'true') == 'true'
 		self.prefer_debrid_direct = getSetting('stremio.debrid_direct', 'true') == 'true'
+		try: self.max_streams = int(getSetting('stremio.max_streams_per_addon', '50'))
+		except: self.max_streams = 50
+		self._debrid_cache = {}
 
 	def _load_addons(self):
 		"""Load configured Stremio addons from settings"""
 		addons = []
 		try:
-			import ast
 			addons_str = getSetting('stremio.addons', '')
 			if addons_str:
-				addons = ast.literal_eval(addons_str)
+				try: addons = _loads(addons_str)
+				except: addons = ast.literal_eval(addons_str)
 		except:
 			pass
 		return addons if isinstance(addons, list) else []
 
 	def _parse_stream_info(self, stream, addon_info=None):
 		"""Parse stream object to extract metadata with enhanced support"""
-		info = {
-			'hash': None,
-			'url': None,
-			'name': '',
-			'seeders': 0,
-			'size': 0,
-			'size_str': '',
-			'quality': 'SD',
-			'provider': '',
-			'file_idx': None,
-			'is_debrid_resolved': False,
-			'proxy_headers': None,
-			'subtitles': [],
-			'binge_group': None,
-			'stream_type': 'unknown',
-			'youtube_id': None,
-			'external_url': None,
-			'codec': '',
-			'hdr': '',
-			'audio': ''
-		}
+		info = StreamInfo()
+
+		sget = stream.get
 
 		# Determine stream type and extract source
 		if 'infoHash' in stream:
-			info['hash'] = stream['infoHash'].lower()
-			info['stream_type'] = 'torrent'
+			info.hash = stream['infoHash'].lower()
+			info.stream_type = 'torrent'
 			if 'fileIdx' in stream:
-				info['file_idx'] = stream['fileIdx']
+				info.file_idx = stream['fileIdx']
 
 		if 'url' in stream:
-			info['url'] = stream['url']
-			if not info['hash']:
-				info['stream_type'] = 'direct'
+			info.url = stream['url']
+			if not info.hash:
+				info.stream_type = 'direct'
 			# Check if URL is a debrid-resolved link
 			if RE_DEBRID_URL.search(stream['url']):
-				info['is_debrid_resolved'] = True
-				info['stream_type'] = 'debrid_direct'
+				info.is_debrid_resolved = True
+				info.stream_type = 'debrid_direct'
 
 		if 'ytId' in stream:
-			info['youtube_id'] = stream['ytId']
-			info['stream_type'] = 'youtube'
-			info['url'] = f"plugin://plugin.video.youtube/play/?video_id={stream['ytId']}"
+			info.youtube_id = stream['ytId']
+			info.stream_type = 'youtube'
+			info.url = f"plugin://plugin.video.youtube/play/?video_id={stream['ytId']}"
 
 		if 'externalUrl' in stream:
-			info['external_url'] = stream['externalUrl']
-			info['stream_type'] = 'external'
+			info.external_url = stream['externalUrl']
+			info.stream_type = 'external'
 
-		# Get stream name/title for parsing
-		name = stream.get('name', '') or stream.get('title', '') or ''
-		description = stream.get('description', '') or stream.get('title', '') or ''
-		full_text = f"{name}\n{description}"
+		# Get stream name/title for parsing; skip the concat (and the doubled
+		# regex scans) when description just repeats the name
+		name = sget('name') or sget('title') or ''
+		description = sget('description') or sget('title') or ''
+		scan_text = name if (not description or description == name) else name + '\n' + description
 
 		# Extract behavior hints
-		behavior_hints = stream.get('behaviorHints', {})
+		behavior_hints = sget('behaviorHints') or {}
+		bhget = behavior_hints.get
 
 		# Extract proxy headers for authenticated streams
-		if 'proxyHeaders' in behavior_hints:
-			proxy_headers = behavior_hints['proxyHeaders']
-			if proxy_headers.get('request'):
-				info['proxy_headers'] = proxy_headers['request']
+		proxy_headers = bhget('proxyHeaders')
+		if proxy_headers and proxy_headers.get('request'):
+			info.proxy_headers = proxy_headers['request']
 
 		# Extract binge group for autoplay optimization
-		if 'bingeGroup' in behavior_hints:
-			info['binge_group'] = behavior_hints['bingeGroup']
+		binge_group = bhget('bingeGroup')
+		if binge_group:
+			info.binge_group = binge_group
 
 		# Extract release name - prefer behaviorHints.filename if available
-		if behavior_hints.get('filename'):
-			info['name'] = behavior_hints['filename']
+		filename = bhget('filename')
+		if filename:
+			info.name = filename
 		elif name:
 			# Parse name from first line (common Stremio format)
 			lines = name.split('\n')
-			info['name'] = lines[0].strip() if lines else name
+			info.name = lines[0].strip() if lines else name
 
 		# Extract seeders
-		seeders_match = RE_SEEDERS.search(full_text)
+		seeders_match = RE_SEEDERS.search(scan_text)
 		if seeders_match:
 			try:
-				info['seeders'] = int(seeders_match.group(1))
+				info.seeders = int(seeders_match.group(1))
 			except:
 				pass
 
 		# Extract size
-		size_match = RE_SIZE.search(full_text)
+		size_match = RE_SIZE.search(scan_text)
 		if size_match:
-			info['size_str'] = size_match.group(1)
+			info.size_str = size_match.group(1)
 			try:
-				dsize, isize = source_utils._size(info['size_str'])
-				info['size'] = dsize
-				info['size_str'] = isize
+				dsize, isize = source_utils._size(info.size_str)
+				info.size = dsize
+				info.size_str = isize
 			except:
 				pass
 
 		# Check behaviorHints for size (videoSize in bytes)
-		if not info['size'] and behavior_hints.get('videoSize'):
+		video_size = bhget('videoSize')
+		if not info.size and video_size:
 			try:
-				video_size = int(behavior_hints['videoSize'])
-				info['size'] = round(video_size / (1024 * 1024 * 1024), 2)
-				info['size_str'] = f"{info['size']:.2f} GB"
+				video_size = int(video_size)
+				info.size = round(video_size / (1024 * 1024 * 1024), 2)
+				info.size_str = f"{info.size:.2f} GB"
 			except:
 				pass
 
-		# Extract quality
-		quality_match = RE_QUALITY.search(full_text) or RE_QUALITY.search(info['name'])
-		if quality_match:
-			q = quality_match.group(1).lower()
-			if q in ('2160p', '4k', 'uhd'):
-				info['quality'] = '4K'
-			elif q == '1080p':
-				info['quality'] = '1080p'
-			elif q == '720p':
-				info['quality'] = '720p'
-			else:
-				info['quality'] = 'SD'
-
-		# Extract codec info
-		codec_match = RE_CODEC.search(full_text) or RE_CODEC.search(info['name'])
-		if codec_match:
-			info['codec'] = codec_match.group(1).upper()
-
-		# Extract HDR info
-		hdr_match = RE_HDR.search(full_text) or RE_HDR.search(info['name'])
-		if hdr_match:
-			info['hdr'] = hdr_match.group(1).upper()
-
-		# Extract audio info
-		audio_match = RE_AUDIO.search(full_text) or RE_AUDIO.search(info['name'])
-		if audio_match:
-			info['audio'] = audio_match.group(1).upper()
+		# Extract quality/codec/HDR/audio in one fused scan; first hit per group wins
+		if info.name and info.name not in scan_text:
+			scan_text = f"{scan_text}\n{info.name}"
+		quality = codec = hdr = audio = None
+		for m in RE_META.finditer(scan_text):
+			group = m.lastgroup
+			if group == 'quality':
+				if quality is None: quality = m.group().lower()
+			elif group == 'codec':
+				if codec is None: codec = m.group()
+			elif group == 'hdr':
+				if hdr is None: hdr = m.group()
+			elif audio is None: audio = m.group()
+			if quality and codec and hdr and audio: break
+		if quality:
+			info.quality = _QUALITY_MAP.get(quality, 'SD')
+		if codec:
+			info.codec = codec.upper()
+		if hdr:
+			info.hdr = hdr.upper()
+		if audio:
+			info.audio = audio.upper()
 
 		# Extract subtitles if available
 		if 'subtitles' in stream:
-			info['subtitles'] = stream['subtitles']
+			info.subtitles = stream['subtitles']
 
 		return info
 
@@ -194,23 +249,14 @@ class source:
 		"""Fetch streams from a Stremio addon with enhanced error handling"""
 		streams = []
 		try:
-			# Clean up addon URL
-			base_url = addon_url.rstrip('/')
-			if base_url.endswith('/manifest.json'):
-				base_url = base_url[:-14]
-
 			# Build stream endpoint
-			endpoint = f"{base_url}/stream/{media_type}/{media_id}.json"
+			endpoint = f"{_base_url(addon_url)}/stream/{media_type}/{media_id}.json"
 
-			response = requests.get(
-				endpoint,
-				timeout=self.timeout,
-				headers={'User-Agent': 'POV-Kodi/1.0'}
-			)
+			response = _http_get(endpoint, timeout=self.timeout)
 
-			if response.status_code == 200:
-				data = response.json()
-				streams = data.get('streams', [])
+			if response.status_code == 200 and response.content:
+				data = _loads(response.content)
+				streams = data.get('streams') or []
 		except requests.exceptions.Timeout:
 			source_utils.scraper_error('STREMIO_TIMEOUT')
 		except requests.exceptions.ConnectionError:
@@ -225,20 +271,12 @@ class source:
 		if not self.fetch_subtitles:
 			return subtitles
 		try:
-			base_url = addon_url.rstrip('/')
-			if base_url.endswith('/manifest.json'):
-				base_url = base_url[:-14]
+			endpoint = f"{_base_url(addon_url)}/subtitles/{media_type}/{media_id}.json"
 
-			endpoint = f"{base_url}/subtitles/{media_type}/{media_id}.json"
-
-			response = requests.get(
-				endpoint,
-				timeout=5,
-				headers={'User-Agent': 'POV-Kodi/1.0'}
-			)
+			response = _http_get(endpoint, timeout=5)
 
 			if response.status_code == 200:
-				data = response.json()
+				data = _loads(response.content)
 				subtitles = data.get('subtitles', [])
 		except:
 			pass
@@ -247,25 +285,24 @@ class source:
 	def _get_addon_name(self, addon_url):
 		"""Extract addon name from URL or fetch from manifest"""
 		try:
-			base_url = addon_url.rstrip('/')
-			if base_url.endswith('/manifest.json'):
-				base_url = base_url[:-14]
+			base_url = _base_url(addon_url)
+
+			name = _ADDON_NAME_CACHE.get(base_url)
+			if name:
+				return name
 
 			# Try to fetch manifest for name
-			response = requests.get(
-				f"{base_url}/manifest.json",
-				timeout=3,
-				headers={'User-Agent': 'POV-Kodi/1.0'}
-			)
+			response = _http_get(f"{base_url}/manifest.json", timeout=3)
 			if response.status_code == 200:
-				manifest = response.json()
-				return manifest.get('name', 'stremio')
+				manifest = _loads(response.content)
+				name = manifest.get('name', 'stremio')
+				_ADDON_NAME_CACHE[base_url] = name
+				return name
 		except:
 			pass
 
 		# Fallback: extract from URL
 		try:
-			from urllib.parse import urlparse
 			parsed = urlparse(addon_url)
 			return parsed.netloc.split('.')[0]
 		except:
@@ -278,16 +315,11 @@ class source:
 
 		# Check both URL and config URL for debrid patterns
 		check_url = config_url or addon_url
-		debrid_patterns = [
-			'realdebrid=', 'rd=', 'debridKey=',
-			'premiumize=', 'pm=',
-			'alldebrid=', 'ad=',
-			'torbox=', 'tb=',
-			'offcloud=', 'oc=',
-			'debrid-link=', 'dl=',
-			'easydebrid=', 'ed='
-		]
-		return any(pattern in check_url.lower() for pattern in debrid_patterns)
+		flag = self._debrid_cache.get(check_url)
+		if flag is None:
+			flag = bool(RE_DEBRID_CONFIG.search(check_url))
+			self._debrid_cache[check_url] = flag
+		return flag
 
 	def _build_source_item(self, stream_info, addon_name, title, aliases, hdlr, year,
 						   episode_title, total_seasons, season, undesirables, check_foreign_audio):
@@ -295,18 +327,18 @@ class source:
 		package, episode_start, episode_end, last_season = None, 0, 0, 0
 
 		# Skip if no valid source
-		if not stream_info['hash'] and not stream_info['url'] and not stream_info['youtube_id']:
+		if not stream_info.hash and not stream_info.url and not stream_info.youtube_id:
 			return None
 
 		# Skip external URLs (Netflix, etc.) - can't play directly
-		if stream_info['stream_type'] == 'external':
+		if stream_info.stream_type == 'external':
 			return None
 
-		name = source_utils.clean_name(stream_info['name']) if stream_info['name'] else ''
+		name = source_utils.clean_name(stream_info.name) if stream_info.name else ''
 
 		# Title validation
 		if name:
-			if not source_utils.check_title(title, aliases, name, hdlr, year):
+			if not self._check_title(name):
 				if total_seasons is None:
 					return None
 				valid, last_season = source_utils.filter_show_pack(title, aliases, '', year, season, name, total_seasons)
@@ -319,7 +351,7 @@ class source:
 				else:
 					package = 'show'
 
-			name_info = source_utils.info_from_name(name, title, year, hdlr, episode_title)
+			name_info = self._info_from_name(name)
 			if source_utils.remove_lang(name_info, check_foreign_audio):
 				return None
 			if undesirables and source_utils.remove_undesirables(name_info, undesirables):
@@ -328,50 +360,50 @@ class source:
 			name_info = ''
 
 		# Check seeders for torrents
-		if stream_info['stream_type'] == 'torrent' and self.min_seeders > stream_info['seeders']:
+		if stream_info.stream_type == 'torrent' and self.min_seeders > stream_info.seeders:
 			return None
 
 		# Get quality
-		quality = stream_info['quality']
+		quality = stream_info.quality
 		if name_info:
-			detected_quality, info = source_utils.get_release_quality(name_info, stream_info.get('url', ''))
+			detected_quality, info = source_utils.get_release_quality(name_info, stream_info.url or '')
 			if detected_quality != 'SD':
 				quality = detected_quality
 		else:
 			info = []
 
 		# Add codec/HDR/audio info
-		if stream_info['codec']:
-			info.append(f"[B]{stream_info['codec']}[/B]")
-		if stream_info['hdr']:
-			info.append(f"[B]{stream_info['hdr']}[/B]")
-		if stream_info['audio']:
-			info.append(stream_info['audio'])
+		if stream_info.codec:
+			info.append(f"[B]{stream_info.codec}[/B]")
+		if stream_info.hdr:
+			info.append(f"[B]{stream_info.hdr}[/B]")
+		if stream_info.audio:
+			info.append(stream_info.audio)
 
 		# Add size to info
-		if stream_info['size_str']:
-			info.insert(0, stream_info['size_str'])
+		if stream_info.size_str:
+			info.insert(0, stream_info.size_str)
 
 		info_str = ' | '.join(info) if info else ''
 
 		# Build source URL and determine type
-		if stream_info['stream_type'] == 'torrent':
-			url = 'magnet:?xt=urn:btih:%s&dn=%s' % (stream_info['hash'], name or stream_info['hash'])
+		if stream_info.stream_type == 'torrent':
+			url = 'magnet:?xt=urn:btih:%s&dn=%s' % (stream_info.hash, name or stream_info.hash)
 			source_type = 'torrent'
 			is_direct = False
 			is_debridonly = True
-		elif stream_info['stream_type'] == 'youtube':
-			url = stream_info['url']
+		elif stream_info.stream_type == 'youtube':
+			url = stream_info.url
 			source_type = 'youtube'
 			is_direct = True
 			is_debridonly = False
-		elif stream_info['is_debrid_resolved']:
-			url = stream_info['url']
+		elif stream_info.is_debrid_resolved:
+			url = stream_info.url
 			source_type = 'debrid_direct'
 			is_direct = True
 			is_debridonly = False
 		else:
-			url = stream_info['url']
+			url = stream_info.url
 			source_type = 'direct'
 			is_direct = True
 			is_debridonly = False
@@ -387,32 +419,32 @@ class source:
 			'name_info': name_info,
 			'quality': quality,
 			'info': info_str,
-			'size': stream_info['size'],
-			'seeders': stream_info['seeders']
+			'size': stream_info.size,
+			'seeders': stream_info.seeders
 		}
 
 		# Add hash for torrents
-		if stream_info['hash']:
-			item['hash'] = stream_info['hash']
+		if stream_info.hash:
+			item['hash'] = stream_info.hash
 
 		# Add file index for multi-file torrents
-		if stream_info['file_idx'] is not None:
-			item['file_idx'] = stream_info['file_idx']
+		if stream_info.file_idx is not None:
+			item['file_idx'] = stream_info.file_idx
 
 		# Add proxy headers for authenticated streams
-		if stream_info['proxy_headers']:
-			item['proxy_headers'] = stream_info['proxy_headers']
+		if stream_info.proxy_headers:
+			item['proxy_headers'] = stream_info.proxy_headers
 
 		# Add binge group for autoplay optimization
-		if stream_info['binge_group']:
-			item['binge_group'] = stream_info['binge_group']
+		if stream_info.binge_group:
+			item['binge_group'] = stream_info.binge_group
 
 		# Add subtitles if available
-		if stream_info['subtitles']:
-			item['stremio_subtitles'] = stream_info['subtitles']
+		if stream_info.subtitles:
+			item['stremio_subtitles'] = stream_info.subtitles
 
 		# Add debrid resolved flag
-		if stream_info['is_debrid_resolved']:
+		if stream_info.is_debrid_resolved:
 			item['debrid_resolved'] = True
 
 		# Add pack info
@@ -463,18 +495,34 @@ class source:
 			undesirables = source_utils.get_undesirables()
 			check_foreign_audio = source_utils.check_foreign_audio()
 
+			# identical release names recur across addons; memoize the heavy
+			# parsing per call (title/aliases/hdlr are invariant, only name varies)
+			self._check_title = lru_cache(maxsize=4096)(
+				lambda n: source_utils.check_title(title, aliases, n, hdlr, year)
+			)
+			self._info_from_name = lru_cache(maxsize=4096)(
+				lambda n: source_utils.info_from_name(n, title, year, hdlr, episode_title)
+			)
+
 		except:
 			source_utils.scraper_error('STREMIO')
 			return sources
 
-		# Sort addons - prefer debrid-configured addons if setting enabled
-		sorted_addons = self.addons
+		# Sort addons - prefer debrid-configured addons if setting enabled;
+		# classify each addon once and remember the flag for the fetch loop
+		is_debrid_map = {}
 		if self.prefer_debrid_direct:
-			debrid_addons = [a for a in self.addons if self._is_debrid_configured_addon(a)]
-			other_addons = [a for a in self.addons if not self._is_debrid_configured_addon(a)]
+			debrid_addons, other_addons = [], []
+			for a in self.addons:
+				flag = self._is_debrid_configured_addon(a)
+				is_debrid_map[id(a)] = flag
+				(debrid_addons if flag else other_addons).append(a)
 			sorted_addons = debrid_addons + other_addons
+		else:
+			sorted_addons = self.addons
 
-		# Process each configured addon
+		# Resolve per-addon context up front, then fan the fetches out in parallel
+		contexts = []
 		for addon in sorted_addons:
 			try:
 				addon_url = addon.get('url', '') if isinstance(addon, dict) else addon
@@ -485,41 +533,85 @@ class source:
 				# Use config URL for fetching if available (has debrid settings)
 				fetch_url = config_url if config_url else addon_url
 
+				# defer _get_addon_name (may hit the network) until the addon
+				# actually produces a stream
 				addon_name = addon.get('name', '') if isinstance(addon, dict) else ''
-				if not addon_name:
-					addon_name = self._get_addon_name(addon_url)
 
 				addon_info = addon if isinstance(addon, dict) else {'url': addon}
-				is_debrid_addon = self._is_debrid_configured_addon(addon)
+				is_debrid_addon = is_debrid_map.get(id(addon))
+				if is_debrid_addon is None:
+					is_debrid_addon = self._is_debrid_configured_addon(addon)
+				contexts.append((addon_url, fetch_url, addon_name or None, addon_info, is_debrid_addon))
+			except:
+				source_utils.scraper_error('STREMIO')
+				continue
 
-				streams = self._fetch_streams(fetch_url, media_type, media_id, addon_info)
+		if not contexts:
+			return sources
 
-				for stream in streams:
-					try:
-						stream_info = self._parse_stream_info(stream, addon_info)
+		executor = ThreadPoolExecutor(max_workers=min(16, len(contexts)))
+		futures = {
+			executor.submit(self._fetch_streams, ctx[1], media_type, media_id, ctx[3]): ctx
+			for ctx in contexts
+		}
+
+		seen = set()
 
-						# If this is a debrid-configured addon and we got a direct URL,
-						# mark it as debrid resolved
-						if is_debrid_addon and stream_info['url'] and not stream_info['hash']:
-							stream_info['is_debrid_resolved'] = True
-							stream_info['stream_type'] = 'debrid_direct'
+		for future in as_completed(futures):
+			addon_url, fetch_url, addon_name, addon_info, is_debrid_addon = futures[future]
+			try:
+				streams = future.result()
+				if streams and addon_name is None:
+					addon_name = self._get_addon_name(addon_url)
+
+				# oversized lists are mostly low-seed duplicates; keep top-K
+				# by a cheap seeders scan before the expensive parse/build work
+				if self.max_streams and len(streams) > self.max_streams:
+					pairs = []
+					for s in streams:
+						if not isinstance(s, dict): continue
+						text = s.get('title') or s.get('description') or s.get('name') or ''
+						m = RE_SEEDERS.search(text)
+						pairs.append((int(m.group(1)) if m else 0, s))
+					pairs.sort(key=lambda p: p[0], reverse=True)
+					streams = [s for _, s in pairs[:self.max_streams]]
 
-						item = self._build_source_item(
-							stream_info, addon_name, title, aliases, hdlr, year,
-							episode_title, total_seasons, season, undesirables, check_foreign_audio
-						)
+				for stream in streams:
+					# cheap structural guard instead of a per-stream try/except
+					if not isinstance(stream, dict):
+						continue
 
-						if item:
-							sources_append(item)
+					stream_info = self._parse_stream_info(stream, addon_info)
 
-					except:
-						source_utils.scraper_error('STREMIO')
+					# Skip duplicates returned by overlapping addons before the
+					# expensive title/pack validation work
+					if stream_info.hash:
+						key = ('h', stream_info.hash, stream_info.file_idx)
+					else:
+						key = ('u', stream_info.url)
+					if key in seen:
 						continue
+					seen.add(key)
+
+					# If this is a debrid-configured addon and we got a direct URL,
+					# mark it as debrid resolved
+					if is_debrid_addon and stream_info.url and not stream_info.hash:
+						stream_info.is_debrid_resolved = True
+						stream_info.stream_type = 'debrid_direct'
+
+					item = self._build_source_item(
+						stream_info, addon_name, title, aliases, hdlr, year,
+						episode_title, total_seasons, season, undesirables, check_foreign_audio
+					)
+
+					if item:
+						sources_append(item)
 
 			except:
 				source_utils.scraper_error('STREMIO')
 				continue
 
+		executor.shutdown(wait=False)
 		return sources
 
 	def sources_packs(self, data, hostDict, search_series=False, total_seasons=None, bypass_filter=False):
@@ -1,7 +1,15 @@
 import re
 import json
 import random
+try: from orjson import loads as _loads
+except ImportError:
+	try: from ujson import loads as _loads
+	except ImportError: from json import loads as _loads
+from time import time, monotonic
+from pprint import pformat
 from threading import Thread
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
+from modules.source_utils import supported_video_extensions, seas_ep_filter, extras_filter
 from debrids import alldebrid_api, premiumize_api, real_debrid_api, torbox_api, offcloud_api, easydebrid_api
 from caches.debrid_cache import DebridCache
 from indexers import metadata
@@ -12,8 +20,9 @@ from modules import kodi_utils, settings
 ls, get_setting, notification = kodi_utils.local_string, kodi_utils.get_setting, kodi_utils.notification
 show_busy_dialog, hide_busy_dialog = kodi_utils.show_busy_dialog, kodi_utils.hide_busy_dialog
 ok_dialog, confirm_dialog, select_dialog = kodi_utils.ok_dialog, kodi_utils.confirm_dialog, kodi_utils.select_dialog
-default_internal_scrapers, enabled_debrids_check = settings.default_internal_scrapers, settings.enabled_debrids_check
-default_hosters_providers = ('real-debrid', 'premiumize.me', 'alldebrid')
+# frozensets for the per-source membership tests in resolve_sources
+default_internal_scrapers, enabled_debrids_check = frozenset(settings.default_internal_scrapers), settings.enabled_debrids_check
+default_hosters_providers = frozenset(('real-debrid', 'premiumize.me', 'alldebrid'))
 plswait_str, checking_debrid_str, remaining_debrid_str = ls(32577), ls(32578), ls(32579)
 
 debrid_list = (
@@ -25,9 +34,11 @@ debrid_list = (
 	('easydebrid', 'ed', easydebrid_api.EasyDebridAPI)
 )
 
+_DEBRID_BY_NAME = {i[0]: i for i in debrid_list}
+
 def import_debrid(debrid_provider):
-	cls = next((i[2] for i in debrid_list if i[0] == debrid_provider), None)
-	return cls() if cls else cls
+	row = _DEBRID_BY_NAME.get(debrid_provider)
+	return row[2]() if row else None
 
 def debrid_enabled():
 	return [i[0] for i in debrid_list if enabled_debrids_check(i[1])]
@@ -38,9 +49,18 @@ def debrid_type_enabled(debrid_type, enabled_debrids):
 def debrid_valid_hosts(enabled_debrids):
 	return []
 
+# identical unrestrict/pack calls inside a session return the same signed
+# links for far longer than this TTL, so a short window is safe
+_RESOLVE_TTL = 300
+_resolve_cache, _pack_cache = {}, {}
+_GB = 1 << 30
+
+# background janitor for fire-and-forget cleanup/write jobs; a shared pool
+# keeps thread growth bounded under large scrapes
+_BG = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pov-bg')
+
 class Source:
 	def dumps(self, depth=1, width=172):
-		from pprint import pformat
 		return pformat(vars(self), depth=depth, width=width)
 
 	def __init__(self, source_dict, meta=None):
@@ -71,10 +91,10 @@ class Source:
 		except: pass
 
 	def resolve_external_sources(self, api, title, season, episode):
-		from modules.source_utils import supported_video_extensions, seas_ep_filter, extras_filter
 		try:
 			extensions = supported_video_extensions()
-			extras_filtering_list = tuple(i for i in extras_filter() if not i in title.lower())
+			title_lower = title.lower()
+			extras_filtering_list = tuple(i for i in extras_filter() if not i in title_lower)
 			if self.debrid in ('real-debrid', 'alldebrid'): args = self.url, self.hash, True
 			else: args = self.url, self.hash
 			files = api.parse_magnet_pack(*args)
@@ -83,25 +103,30 @@ class Source:
 			for i in files or selected_files:
 				torrent_id, filename = i.get('torrent_id'), i['filename'].lower()
 				if filename.endswith('.m2ts'): raise Exception('_m2ts_check failed')
-				if not filename.endswith(tuple(extensions)): continue
+				if not filename.endswith(extensions): continue
 				if season and not seas_ep_filter(season, episode, filename): continue
 				elif any(x in filename for x in extras_filtering_list): continue
 				selected_files_append(i)
+				# the episode match is unique, no point scanning the rest of the pack
+				if season: break
 			if not selected_files: raise Exception('selected_files failed')
 			if not season: selected_files.sort(key=lambda k: k['size'], reverse=True)
 			file_key = next((i['link'] for i in selected_files), None)
 			if self.debrid in ('premiumize.me',): file_url = api.add_headers_to_url(file_key)
 			else: file_url = api.unrestrict_link(file_key)
 			if self.debrid in ('premiumize.me',):
-				if api.store_to_cloud: Thread(target=api.create_transfer, args=(self.url,)).start()
+				if api.store_to_cloud: _BG.submit(api.create_transfer, self.url)
 			if self.debrid in ('real-debrid', 'alldebrid', 'torbox'):
-				if not api.store_to_cloud: Thread(target=api.delete_torrent, args=(torrent_id,)).start()
+				if not api.store_to_cloud: _BG.submit(api.delete_torrent, torrent_id)
 			return file_url
 		except Exception as e:
 			kodi_utils.logger('resolve_external_sources exception', f"{e}\n{self.dumps()}")
-			if files and torrent_id: Thread(target=api.delete_torrent, args=(torrent_id,)).start()
+			if files and torrent_id: _BG.submit(api.delete_torrent, torrent_id)
 
 	def resolve_internal_sources(self, direct_debrid_link=False):
+		key = (self.scrape_provider, getattr(self, 'id', None), direct_debrid_link, getattr(self, 'url_dl', None))
+		cached = _resolve_cache.get(key)
+		if cached and cached[1] > time(): return cached[0]
 		try:
 			if self.scrape_provider == 'tb_cloud':
 				if direct_debrid_link == 'usenet': function = 'unrestrict_usenet'
@@ -128,6 +153,7 @@ class Source:
 					with kodi_utils.open_file(self.url_dl) as f: url = f.read()
 				else: url = self.url_dl
 			else: url = self.url_dl
+			if url: _resolve_cache[key] = (url, time() + _RESOLVE_TTL)
 			return url
 		except Exception as e:
 			kodi_utils.logger('resolve_internal_sources exception', f"{e}\n{self.dumps()}")
@@ -135,15 +161,22 @@ class Source:
 	def browse_packs(self, highlight=None, download=False):
 		show_busy_dialog()
 		api = import_debrid(self.debrid)
-		pack_choices = api.parse_magnet_pack(self.url, self.hash)
+		pack_key = (self.debrid, self.hash)
+		cached = _pack_cache.get(pack_key)
+		if cached and cached[1] > time(): pack_choices = cached[0]
+		else:
+			pack_choices = api.parse_magnet_pack(self.url, self.hash)
+			if pack_choices: _pack_cache[pack_key] = (pack_choices, time() + _RESOLVE_TTL)
 		hide_busy_dialog()
 		if not pack_choices: return None if download else notification(32574)
 		pack_choices.sort(key=lambda k: k['filename'].lower())
-		for item in pack_choices: item.update({
-			'icon': self.meta.get('poster') or api.icon,
-			'line1': clean_file_name(item['filename']),
-			'line2': '%s: %.2f GB' % (ls(32584), float(item['size'])/1073741824)
-		})
+		icon, size_str = self.meta.get('poster') or api.icon, ls(32584)
+		for item in pack_choices:
+			size = item.get('size', 0)
+			if not isinstance(size, (int, float)): size = float(size)
+			item['icon'] = icon
+			item['line1'] = clean_file_name(item['filename'])
+			item['line2'] = f"{size_str}: {size / _GB:.2f} GB"
 		if download: return pack_choices
 		kwargs = {'enumerate': 'true', 'multi_line': 'true'}
 		kwargs.update({'items': json.dumps(pack_choices), 'heading': self.name, 'highlight': highlight})
@@ -160,7 +193,7 @@ class Source:
 		hide_busy_dialog()
 		if not result: return ok_dialog(text='Not Cached at [B]%s[/B]' % self.debrid.upper(), top_space=True)
 		torrent_id = next((i['torrent_id'] for i in result if 'torrent_id' in i), None)
-		if torrent_id: Thread(target=api.delete_torrent, args=(torrent_id,)).start()
+		if torrent_id: _BG.submit(api.delete_torrent, torrent_id)
 		ok_dialog(text='Cached at [B]%s[/B]' % self.debrid.upper(), top_space=True)
 
 	def nzb_cache_and_play(self):
@@ -178,13 +211,19 @@ class Source:
 			if not nzb_id: return kodi_utils.notification(32574)
 			resolved_link = None
 			data = {'files': []}
+			delay, deadline = 500, monotonic() + 1800
 			while not data['files']:
 				if kodi_utils.progressDialog.iscanceled(): return kodi_utils.notification(32736)
+				if monotonic() > deadline: return kodi_utils.notification(32574)
+				if data.get('download_state', '').lower() in ('failed', 'error', 'cancelled'):
+					return kodi_utils.notification(32574)
 				line2 = 'ETA: %s' % data.get('eta', 'NA')
 				progress = int(float(data.get('progress', '0')) * 100)
 				status = status_str % (data.get('download_state', '...').upper(), progress)
 				kodi_utils.progressDialog.update(progress, line % (line1, line2, status))
-				kodi_utils.sleep(500)
+				kodi_utils.sleep(delay)
+				# back off so long grabs stop hammering the status endpoint
+				delay = min(delay * 2, 10000)
 				result = api.nzb_info(nzb_id)
 				if result and 'id' in result: data = result
 			else: resolved_link = api.resolve_nzb(
@@ -220,47 +259,51 @@ class Source:
 
 class DebridCheck:
 	def __init__(self, meta, name):
-		self.cached_list = []
+		self.cached_set = set()
 		self.name, self.debrid, self.function = self._debrid_dict[name]
 		self.imdb, self.season, self.episode = meta.get('imdb_id'), meta.get('season'), meta.get('episode')
 
 	def cache_check(self):
 		try:
-			self.cached_list.extend(i[0] for i in self.cached_hashes if i[1] == self.debrid and i[2] == 'True')
-			unchecked_filter = {h[0] for h in self.cached_hashes if h[1] == self.debrid}
-			unchecked_hashes = [i for i in self.hash_list if not i in unchecked_filter]
+			# one pass over cached_hashes builds both the known and cached sets
+			known = set()
+			known_add, cached_add = known.add, self.cached_set.add
+			for h in self.cached_hashes:
+				if h[1] != self.debrid: continue
+				known_add(h[0])
+				if h[2] == 'True': cached_add(h[0])
+			unchecked_hashes = [i for i in self.hash_list if not i in known]
 			if not unchecked_hashes: return
 			if self.debrid in ('rd', 'ad'): checked_hashes = self.external_check_cache(unchecked_hashes)
-			else: checked_hashes = self.function().check_cache(unchecked_hashes)
+			else: checked_hashes = set(self.function().check_cache(unchecked_hashes) or ())
 			if not checked_hashes: return
 			hashes_to_cache = []
 			process_append = hashes_to_cache.append
-			cached_append = self.cached_list.append
+			cached_add = self.cached_set.add
 			try:
 				for h in unchecked_hashes:
 					if h in checked_hashes:
-						cached_append(h)
+						cached_add(h)
 						cached = 'True'
 					else: cached = 'False'
 					process_append((h, cached))
 			except:
 				for i in unchecked_hashes: process_append((i, 'False'))
-			if hashes_to_cache: Thread(target=self.cache_write, args=(hashes_to_cache,)).start()
-		finally: return self.cached_list
+			if hashes_to_cache: self._pending_writes.append((self.debrid, hashes_to_cache))
+		finally: return list(self.cached_set)
 
 	def external_check_cache(self, unchecked_hashes):
-		checked_hashes = []
-		if self.debrid == 'ad': threads = (
-			Thread(target=mfn_check_cache, args=(self.imdb, self.season, self.episode, checked_hashes)),
-			Thread(target=trz_check_cache, args=(self.imdb, self.season, self.episode, checked_hashes))
+		checked_hashes = set()
+		if self.debrid == 'ad': jobs = (
+			(mfn_check_cache, (self.imdb, self.season, self.episode, checked_hashes)),
+			(trz_check_cache, (self.imdb, self.season, self.episode, checked_hashes))
 		)
-		else: threads = (
-			Thread(target=tio_check_cache, args=(self.imdb, self.season, self.episode, checked_hashes)),
-			Thread(target=dmm_check_cache, args=(unchecked_hashes, self.imdb, checked_hashes))
+		else: jobs = (
+			(tio_check_cache, (self.imdb, self.season, self.episode, checked_hashes)),
+			(dmm_check_cache, (unchecked_hashes, self.imdb, checked_hashes))
 		)
-		for i in threads: i.start()
-		for i in threads: i.join()
-		return list(set(checked_hashes))
+		futures_wait([_check_pool.submit(fn, *args) for fn, args in jobs])
+		return checked_hashes
 
 	def cache_write(self, hashes):
 		DebridCache().set_many(hashes, self.debrid)
@@ -269,55 +312,111 @@ class DebridCheck:
 	def set_cached_hashes(cls, hash_list):
 		cls.hash_list = hash_list
 		cls.cached_hashes = DebridCache().get_many(hash_list) or []
+		cls._pending_writes = []
+
+	@classmethod
+	def flush_cache_writes(cls):
+		# fold every provider's results into a single batched insert
+		if not cls._pending_writes: return
+		pending, cls._pending_writes = cls._pending_writes, []
+		rows = [(h, debrid, cached) for debrid, hashes in pending for h, cached in hashes]
+		if rows: _BG.submit(cls._write_rows, rows)
+
+	@staticmethod
+	def _write_rows(rows):
+		DebridCache().set_many_multi(rows)
 
 	_debrid_dict = {i[0]: i for i in debrid_list}
-	hash_list, cached_hashes = [], []
+	hash_list, cached_hashes, _pending_writes = [], [], []
+
+# shared by the rd/ad external checks; the per-provider cache_check calls
+# already fan out on the scrape window's pool in sources.py
+_check_pool = ThreadPoolExecutor(max_workers=8)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from fenom.client import randomagent
 
 session = requests.session()
-session.headers.update({'User-Agent': randomagent(), 'Accept': 'application/json'})
+_adapter = HTTPAdapter(
+	pool_connections=16, pool_maxsize=32,
+	max_retries=Retry(total=1, backoff_factor=0.2, status_forcelist=(502, 503, 504), allowed_methods=frozenset(('GET', 'POST')))
+)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+session.headers.update({'User-Agent': randomagent(), 'Accept': 'application/json', 'Accept-Encoding': 'gzip'})
 
-def mfn_check_cache(imdb, season, episode, collector):
+# hashes sit in their own hex-only path segment, so one anchored search
+# per url replaces findall()[-1] and its throwaway list
+_HASH_RE = re.compile(r'/([0-9A-Fa-f]{40})(?:[/?#]|$)')
+
+_MFN_BASE = 'https://mediafusion.elfhosted.com/%s/stream/' % (
+	'D-T2iZoymNCCD1T5c2sX5u8tIZVcgcFWlCsCJ72rCmrU2mDdmvgieM-lvX-bp4h_ExG1IpHLObtgmLCC'
+	'k_QbhNTZz32wbhNmYO1HLaefzqGoYjcIhiUH-MWgL-dMxyrTPR2fo2--HtvH0V5KpEi6vPfjKKGBmpe3'
+	'wRD0c_QsSxlcQ'
+)
+_TRZ_BASE = 'https://stremthru.elfhosted.com/stremio/torz/%s/stream/' % (
+	'eyJzdG9yZXMiOlt7ImMiOiJhZCIsInQiOiJzdGF0aWNEZW1vQXBpa2V5UHJlbSJ9XSwiY2FjaGVkIjp0cnVlfQ=='
+)
+_TIO_BASE = 'https://torrentio.strem.fun/%s/stream/' % (
+	'debridoptions=nodownloadlinks,nocatalog|realdebrid=T2iZoymNCCD1T5c2sX5u8tIZVcgcFWlCsCJ72rCmrU2mDdmvgieM'
+)
+
+# the external checks are pure functions of (imdb, season, episode), so
+# re-scrapes of the same episode inside the TTL skip the network entirely
+_EXT_TTL = 300
+_EXT_CACHE = {}
+
+def _ext_cached(key, fetch):
+	hit = _EXT_CACHE.get(key)
+	now = monotonic()
+	if hit and hit[0] > now: return hit[1]
+	val = fetch()
+	# None signals a failed fetch, retry on the next scrape instead of
+	# caching the outage for the whole TTL
+	if val is None: return []
+	if len(_EXT_CACHE) > 512: _EXT_CACHE.clear()
+	_EXT_CACHE[key] = (now + _EXT_TTL, val)
+	return val
+
+def _stream_check_cache(base, marker, imdb, season, episode, heading):
 	if str(season).isdigit(): url = 'series/%s:%s:%s.json' % (imdb, season, episode)
 	else: url = 'movie/%s.json' % (imdb)
-	params = (
-		'D-T2iZoymNCCD1T5c2sX5u8tIZVcgcFWlCsCJ72rCmrU2mDdmvgieM-lvX-bp4h_ExG1IpHLObtgmLCC'
-		'k_QbhNTZz32wbhNmYO1HLaefzqGoYjcIhiUH-MWgL-dMxyrTPR2fo2--HtvH0V5KpEi6vPfjKKGBmpe3'
-		'wRD0c_QsSxlcQ'
-	)
-	url = 'https://mediafusion.elfhosted.com/%s/stream/%s' % (params, url)
-	pattern = re.compile(r'\b\w{40}\b')
+	url = base + url
 	try:
 		results = session.get(url, timeout=7.05)
-		files = results.json()['streams']
-		collector.extend(pattern.findall(file['url'])[-1] for file in files if '⚡' in file['name'] and 'url' in file)
-	except Exception as e: kodi_utils.logger('mfn error', str(e))
+		files = _loads(results.content)['streams']
+		hashes = []
+		hashes_append = hashes.append
+		for file in files:
+			if marker not in file.get('name', ''): continue
+			file_url = file.get('url')
+			if not file_url: continue
+			m = _HASH_RE.search(file_url)
+			if m: hashes_append(m.group(1))
+		return hashes
+	except Exception as e:
+		kodi_utils.logger(heading, str(e))
+		return None
+
+def mfn_check_cache(imdb, season, episode, collector):
+	collector.update(_ext_cached(
+		('mfn', imdb, season, episode),
+		lambda: _stream_check_cache(_MFN_BASE, '⚡', imdb, season, episode, 'mfn error')
+	))
 
 def trz_check_cache(imdb, season, episode, collector):
-	if str(season).isdigit(): url = 'series/%s:%s:%s.json' % (imdb, season, episode)
-	else: url = 'movie/%s.json' % (imdb)
-	params = 'eyJzdG9yZXMiOlt7ImMiOiJhZCIsInQiOiJzdGF0aWNEZW1vQXBpa2V5UHJlbSJ9XSwiY2FjaGVkIjp0cnVlfQ=='
-	url = 'https://stremthru.elfhosted.com/stremio/torz/%s/stream/%s' % (params, url)
-	pattern = re.compile(r'\b\w{40}\b')
-	try:
-		results = session.get(url, timeout=7.05)
-		files = results.json()['streams']
-		collector.extend(pattern.findall(file['url'])[-1] for file in files if '⚡' in file['name'] and 'url' in file)
-	except Exception as e: kodi_utils.logger('trz error', str(e))
+	collector.update(_ext_cached(
+		('trz', imdb, season, episode),
+		lambda: _stream_check_cache(_TRZ_BASE, '⚡', imdb, season, episode, 'trz error')
+	))
 
 def tio_check_cache(imdb, season, episode, collector):
-	if str(season).isdigit(): url = 'series/%s:%s:%s.json' % (imdb, season, episode)
-	else: url = 'movie/%s.json' % (imdb)
-	params = 'debridoptions=nodownloadlinks,nocatalog|realdebrid=T2iZoymNCCD1T5c2sX5u8tIZVcgcFWlCsCJ72rCmrU2mDdmvgieM'
-	url = 'https://torrentio.strem.fun/%s/stream/%s' % (params, url)
-	pattern = re.compile(r'\b\w{40}\b')
-	try:
-		results = session.get(url, timeout=7.05)
-		files = results.json()['streams']
-		collector.extend(pattern.findall(file['url'])[-1] for file in files if '+' in file['name'] and 'url' in file)
-	except Exception as e: kodi_utils.logger('tio error', str(e))
+	collector.update(_ext_cached(
+		('tio', imdb, season, episode),
+		lambda: _stream_check_cache(_TIO_BASE, '+', imdb, season, episode, 'tio error')
+	))
 
 def dmm_check_cache(unchecked_hashes_chunk, imdb, collector): # DMM API Allows max 100 hashes per request.
 	""" do not thread multiple calls, abusing the api will get it turned off
@@ -330,7 +429,7 @@ def dmm_check_cache(unchecked_hashes_chunk, imdb, collector): # DMM API Allows m
 	data = {'dmmProblemKey': dmmProblemKey, 'solution': solution, 'imdbId': imdb, 'hashes': unchecked_hashes_chunk}
 	try:
 		results = session.post(url, json=data, timeout=7.05)
-		files = results.json()['available']
-		collector.extend(file['hash'] for file in files if 'hash' in file)
+		files = _loads(results.content)['available']
+		collector.update(file['hash'] for file in files if 'hash' in file)
 	except Exception as e: kodi_utils.logger('dmm error', str(e))
 
@@ -369,6 +369,12 @@ def get_setting(setting_id, fallback=None):
 def get_setting_fallback(setting_id):
 	return {setting_id: Addon().getSetting(setting_id)}
 
+def get_settings_bulk(setting_ids):
+	try: settings_dict = json.loads(get_property('pov_settings'))
+	except: settings_dict = make_settings_dict()
+	if settings_dict is None: settings_dict = {i: Addon().getSetting(i) for i in setting_ids}
+	return {i: settings_dict.get(i, '') for i in setting_ids}
+
 def make_settings_dict():
 	import xml.etree.ElementTree as ET
 	settings_dict = None
@@ -61,8 +61,13 @@ def _make_alias_dict(meta, title):
 	if original_title not in alternative_titles: alternative_titles.append(original_title)
 	if alternative_titles: aliases = [{'title': i, 'country': ''} for i in alternative_titles]
 	if country_codes: aliases.extend([{'title': '%s %s' % (title, i), 'country': ''} for i in country_codes])
+	seen = {(i['title'], i['country']) for i in aliases}
 	normalized = ({'title': normalize(i['title']), 'country': i['country']} for i in aliases)
-	aliases.extend(i for i in normalized if not i in aliases)
+	for i in normalized:
+		key = (i['title'], i['country'])
+		if key not in seen:
+			seen.add(key)
+			aliases.append(i)
 	return aliases
 
 def _get_search_year(meta):
@@ -149,34 +154,39 @@ class ExternalSource:
 			self.sources.extend(sources)
 
 	def process_sources(self, provider, sources):
-		try:
-			for i in sources:
+		# bind hot lookups to locals, this loop sees thousands of sources
+		sd, showd, sp = self.season_divider, self.show_divider, self.scrape_provider
+		res, orig_title = self.resolutions, self.orig_title
+		_clean, _gfi, _gfm = clean_file_name, get_file_info, get_filename_match
+		for i in sources:
+			try:
+				i_get = i.get
+				if 'hash' in i: i['hash'] = str(i['hash']).lower()
+				size, size_label, divider = 0, None, None
+				if 'URLName' in i: URLName = i_get('URLName')
+				elif 'name' in i: URLName = _clean(i_get('name')).replace('html', ' ').replace('+', ' ').replace('-', ' ')
+				else: URLName = _gfm(orig_title, i_get('url'), i_get('name'))
+				# trust the provider's parse when it already supplied both
+				if i_get('quality') and 'extraInfo' in i: quality, extraInfo = i_get('quality'), i_get('extraInfo')
+				elif 'name_info' in i: quality, extraInfo = _gfi(name_info=i_get('name_info'))
+				else: quality, extraInfo = _gfi(url=i_get('url'))
 				try:
-					i_get = i.get
-					if 'hash' in i: i['hash'] = str(i['hash']).lower()
-					size, size_label, divider = 0, None, None
-					if 'name' in i: URLName = clean_file_name(i_get('name')).replace('html', ' ').replace('+', ' ').replace('-', ' ')
-					else: URLName = get_filename_match(self.orig_title, i_get('url'), i_get('name'))
-					if 'name_info' in i: quality, extraInfo = get_file_info(name_info=i_get('name_info'))
-					else: quality, extraInfo = get_file_info(url=i_get('url'))
-					try:
-						size = i_get('size')
-						if 'package' in i and not i_get('true_size', False):
-							if i_get('package') == 'season': divider = self.season_divider
-							else: divider = self.show_divider
-							size = float(size) / divider
-							size_label = '%.2f GB' % size
-						else: size_label = '%.2f GB' % size
-					except: pass
-					i.update({
-						'external': True, 'provider': provider, 'scrape_provider': self.scrape_provider, 'URLName': URLName,
-						'extraInfo': extraInfo, 'quality': quality, 'size_label': size_label, 'size': round(size, 2)
-					})
-					if not quality in self.resolutions: self.resolutions['SD'] += 1
-					else: self.resolutions[quality] += 1
-					self.resolutions['total'] += 1
+					size = i_get('size')
+					if 'package' in i and not i_get('true_size', False):
+						if i_get('package') == 'season': divider = sd
+						else: divider = showd
+						size = float(size) / divider
+						size_label = '%.2f GB' % size
+					else: size_label = '%.2f GB' % size
 				except: pass
-		except: pass
+				i.update({
+					'external': True, 'provider': provider, 'scrape_provider': sp, 'URLName': URLName,
+					'extraInfo': extraInfo, 'quality': quality, 'size_label': size_label, 'size': round(size, 2)
+				})
+				if not quality in res: res['SD'] += 1
+				else: res[quality] += 1
+				res['total'] += 1
+			except: pass
 		return sources
 
 	scrape_provider = 'external'
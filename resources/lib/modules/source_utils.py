@@ -1,6 +1,7 @@
 import re
 import json
 import unicodedata
+from functools import lru_cache
 from string import printable
 from urllib.parse import unquote, unquote_plus
 from fenom.control import setting as fenom_getSetting, setSetting as fenom_setSetting
@@ -201,9 +202,10 @@ def get_filename_match(title, url, name=None):
 	except: pass
 	return title_match
 
+@lru_cache(maxsize=1)
 def supported_video_extensions():
 	supported_video_extensions = kodi_utils.supported_media().split('|')
-	return [i for i in supported_video_extensions if not i in ('','.iso','.zip')]
+	return tuple(i for i in supported_video_extensions if not i in ('','.iso','.zip'))
 
 def seas_ep_query_list(season, episode):
 	season = int(season)
@@ -601,6 +601,7 @@ class Manager:
 				fut.name = item
 				self.threads.add(fut)
 			self.wait(debrid_check=True)
+			DebridCheck.flush_cache_writes()
 			for name, hashes in ((fut.name, fut.result() if fut.done() else []) for fut in self.threads):
 				status = ('Unchecked %s' if name in ('real-debrid', 'alldebrid') else 'Uncached %s') % name
 				self.final_sources.extend({**i, 'cache_provider': name, 'debrid': name} for i in torrent_sources if i['hash'] in hashes)
@@ -9,12 +9,54 @@
 """
 
 import json
+import hashlib
 import requests
+try:
+	import orjson
+	_loads, _dumps = orjson.loads, lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+	try:
+		import ujson
+		_loads, _dumps = ujson.loads, ujson.dumps
+	except ImportError:
+		_loads, _dumps = json.loads, json.dumps
+from time import time
+from datetime import timedelta
+from functools import lru_cache
+from threading import Thread
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from caches.main_cache import MainCache
 from modules.kodi_utils import (
 	notification, ok_dialog, confirm_dialog, select_dialog,
-	get_setting, set_setting, dialog, local_string
+	get_setting, get_settings_bulk, set_setting, dialog
 )
 
+# one pooled session so repeat manifest probes reuse TLS connections
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+	pool_connections=16, pool_maxsize=16,
+	max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+_SESSION.headers.update({'User-Agent': 'POV-Kodi/1.0', 'Accept-Encoding': 'gzip'})
+
+# httpx multiplexes parallel manifest probes over one HTTP/2 connection
+# when available; strictly optional, requests remains the baseline
+try:
+	import httpx
+	_client = httpx.Client(
+		http2=True, timeout=10.0, headers={'User-Agent': 'POV-Kodi/1.0'},
+		limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+	)
+	def _http_get(url, timeout=10, headers=None): return _client.get(url, timeout=timeout, headers=headers or {})
+	def _http_head(url, timeout=5): return _client.head(url, timeout=timeout, follow_redirects=True)
+except ImportError:
+	def _http_get(url, timeout=10, headers=None): return _SESSION.get(url, timeout=timeout, headers=headers or {})
+	def _http_head(url, timeout=5): return _SESSION.head(url, timeout=timeout, allow_redirects=True)
+
 
 # Debrid service definitions
 DEBRID_SERVICES = {
@@ -63,66 +105,134 @@ DEBRID_SERVICES = {
 }
 
 
-def get_stremio_addons():
-	"""Get list of configured Stremio addons"""
+# flattened probe rows so the per-call loop is tuple unpacks, not dict chains
+_DEBRID_PROBES = tuple(
+	(sid, s['name'], s['setting_id'], s['enabled_setting'], tuple(s['param_names']))
+	for sid, s in DEBRID_SERVICES.items() if s['setting_id'] and s['enabled_setting']
+)
+
+_SCHEMES = ('http://', 'https://')
+_MF = '/manifest.json'
+
+
+def _normalize_manifest_url(url):
+	"""Normalize user input to a (base_url, manifest_url) pair"""
+	url = url.rstrip('/')
+	if not url.startswith(_SCHEMES):
+		url = 'https://' + url
+	if url.endswith(_MF):
+		return url[:-len(_MF)], url
+	return url, url + _MF
+
+
+# bumped on every save so the lru_cache entries below self-invalidate
+_cache_version = 0
+
+
+@lru_cache(maxsize=4)
+def _load_addons_cached(version):
 	try:
-		import ast
 		addons_str = get_setting('stremio.addons', '')
 		if addons_str:
-			addons = ast.literal_eval(addons_str)
+			try: addons = _loads(addons_str)
+			except:
+				# legacy repr() values from older versions
+				import ast
+				addons = ast.literal_eval(addons_str)
 			return addons if isinstance(addons, list) else []
 	except:
 		pass
 	return []
 
 
+@lru_cache(maxsize=4)
+def _load_debrids_cached(version):
+	values = get_settings_bulk([i for row in _DEBRID_PROBES for i in (row[2], row[3])])
+	enabled = []
+	for service_id, name, setting_id, enabled_setting, param_names in _DEBRID_PROBES:
+		token = values[setting_id]
+		if token and values[enabled_setting] == 'true':
+			enabled.append({
+				'id': service_id, 'name': name,
+				'token': token, 'param_names': param_names
+			})
+	return enabled
+
+
+@lru_cache(maxsize=4)
+def _addon_index_cached(version):
+	addons = _load_addons_cached(version)
+	return {a.get('id') for a in addons}, {a.get('url') for a in addons}
+
+
+def get_stremio_addons():
+	"""Get list of configured Stremio addons"""
+	return _load_addons_cached(_cache_version)
+
+
+def get_stremio_addon_index():
+	"""(ids, urls) sets for O(1) duplicate checks"""
+	return _addon_index_cached(_cache_version)
+
+
 def save_stremio_addons(addons):
 	"""Save Stremio addons list to settings"""
-	set_setting('stremio.addons', repr(addons))
+	global _cache_version
+	# drop transient render caches before persisting
+	for addon in addons:
+		if isinstance(addon, dict):
+			addon.pop('_details_key', None), addon.pop('_details_text', None)
+	set_setting('stremio.addons', _dumps(addons))
+	_cache_version += 1
 
 
 def get_enabled_debrid_services():
 	"""Get list of debrid services that are enabled and have API keys"""
-	enabled = []
-	for service_id, service in DEBRID_SERVICES.items():
-		if service['setting_id'] and service['enabled_setting']:
-			token = get_setting(service['setting_id'], '')
-			is_enabled = get_setting(service['enabled_setting'], 'false') == 'true'
-			if token and is_enabled:
-				enabled.append({
-					'id': service_id,
-					'name': service['name'],
-					'token': token,
-					'param_names': service['param_names']
-				})
-	return enabled
+	return _load_debrids_cached(_cache_version)
 
 
 def validate_stremio_addon(url):
 	"""Validate a Stremio addon URL by fetching its manifest"""
 	try:
 		# Clean up URL
-		base_url = url.rstrip('/')
-		if not base_url.startswith(('http://', 'https://')):
-			base_url = 'https://' + base_url
-
-		# Check if URL ends with manifest.json, if so use as-is
-		if base_url.endswith('/manifest.json'):
-			manifest_url = base_url
-			base_url = base_url[:-14]
+		base_url, manifest_url = _normalize_manifest_url(url)
+
+		# 24h soft-TTL skips the network entirely; after that a conditional
+		# GET lets the host answer 304 and spares the body + decode
+		maincache = MainCache()
+		cache_name = 'stremio_manager_manifest_%s' % hashlib.md5(manifest_url.encode('utf-8')).hexdigest()
+		entry = maincache.get(cache_name)
+		if entry and entry.get('fetched_at', 0) + 86400 > time():
+			manifest = entry['manifest']
 		else:
-			manifest_url = f"{base_url}/manifest.json"
-
-		response = requests.get(
-			manifest_url,
-			timeout=10,
-			headers={'User-Agent': 'POV-Kodi/1.0'}
-		)
-
-		if response.status_code != 200:
-			return None, "Failed to fetch manifest (HTTP %d)" % response.status_code
-
-		manifest = response.json()
+			headers = {}
+			if entry:
+				if entry.get('etag'): headers['If-None-Match'] = entry['etag']
+				if entry.get('last_modified'): headers['If-Modified-Since'] = entry['last_modified']
+			response = _http_get(manifest_url, timeout=10, headers=headers)
+
+			if response.status_code == 304 and entry:
+				manifest = entry['manifest']
+				entry['fetched_at'] = time()
+				maincache.set(cache_name, entry, expiration=timedelta(days=7))
+			elif response.status_code != 200:
+				return None, "Failed to fetch manifest (HTTP %d)" % response.status_code
+			elif not response.content:
+				return None, "Failed to fetch manifest (empty response)"
+			elif response.content.lstrip()[:1] != b'{':
+				# HTML error page from a misrouted host, skip the JSON parser
+				return None, "Invalid JSON response"
+			else:
+				manifest = _loads(response.content)
+				# keep only the keys read below, huge manifests ship catalog
+				# arrays we never look at and would otherwise cache verbatim
+				manifest = {k: manifest[k] for k in (
+					'id', 'name', 'version', 'description', 'resources', 'types', 'behaviorHints'
+				) if k in manifest}
+				maincache.set(cache_name, {
+					'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified'),
+					'manifest': manifest, 'fetched_at': time()
+				}, expiration=timedelta(days=7))
 
 		# Validate required fields
 		if not manifest.get('id'):
@@ -134,26 +244,19 @@ def validate_stremio_addon(url):
 
 		# Check if addon supports streams
 		resources = manifest.get('resources', [])
-		supports_stream = False
-		supports_catalog = False
-		supports_subtitles = False
-
-		for res in resources:
-			res_name = res if isinstance(res, str) else res.get('name', '')
-			if res_name == 'stream':
-				supports_stream = True
-			elif res_name == 'catalog':
-				supports_catalog = True
-			elif res_name == 'subtitles':
-				supports_subtitles = True
+		names = {r if isinstance(r, str) else r.get('name', '') for r in resources}
+		supports_stream = 'stream' in names
+		supports_catalog = 'catalog' in names
+		supports_subtitles = 'subtitles' in names
 
 		if not supports_stream:
 			return None, "Addon does not provide stream resources"
 
 		# Check supported types
 		types = manifest.get('types', [])
-		has_movie_or_series = 'movie' in types or 'series' in types
-		if not has_movie_or_series:
+		types_set = set(types)
+		has_movies, has_series = 'movie' in types_set, 'series' in types_set
+		if not (has_movies or has_series):
 			return None, "Addon does not support movies or series"
 
 		# Check if addon has a configure page
@@ -168,8 +271,8 @@ def validate_stremio_addon(url):
 			'version': manifest.get('version', '1.0.0'),
 			'description': manifest.get('description', ''),
 			'types': types,
-			'has_movies': 'movie' in types,
-			'has_series': 'series' in types,
+			'has_movies': has_movies,
+			'has_series': has_series,
 			'supports_catalog': supports_catalog,
 			'supports_subtitles': supports_subtitles,
 			'configurable': configurable,
@@ -186,38 +289,67 @@ def validate_stremio_addon(url):
 		return None, str(e)
 
 
-def build_addon_config_url(base_url, debrid_service=None, custom_config=None):
-	"""Build a configuration URL for an addon with debrid settings"""
-	config_parts = []
-
-	# Add debrid configuration if provided
-	if debrid_service:
-		param_name = debrid_service['param_names'][0]
-		token = debrid_service['token']
-		config_parts.append(f"{param_name}={token}")
+def _validate_many(urls, timeout=15):
+	"""Validate several addon URLs concurrently; returns {url: (info, error)}"""
+	results = {}
+	if not urls:
+		return results
+	executor = ThreadPoolExecutor(max_workers=min(16, len(urls)))
+	futures = {executor.submit(validate_stremio_addon, url): url for url in urls}
+	try:
+		for future in as_completed(futures, timeout=timeout):
+			results[futures[future]] = future.result()
+	except:
+		pass
+	executor.shutdown(wait=False)
+	return results
 
-	# Add custom configuration parts
-	if custom_config:
-		for key, value in custom_config.items():
-			config_parts.append(f"{key}={value}")
 
+@lru_cache(maxsize=128)
+def _build_config_url_cached(base_url, param_name, token, custom_tuple):
+	config_parts = []
+	if param_name:
+		config_parts.append(f"{param_name}={token}")
+	for key, value in custom_tuple:
+		config_parts.append(f"{key}={value}")
 	if config_parts:
 		config_string = '|'.join(config_parts)
 		# Most Stremio addons use /{config}/manifest.json format
 		return f"{base_url.rstrip('/')}/{config_string}"
-
 	return base_url
 
 
+def build_addon_config_url(base_url, debrid_service=None, custom_config=None):
+	"""Build a configuration URL for an addon with debrid settings"""
+	if debrid_service: param_name, token = debrid_service['param_names'][0], debrid_service['token']
+	else: param_name, token = None, None
+	custom_tuple = tuple(sorted(custom_config.items())) if custom_config else ()
+	return _build_config_url_cached(base_url, param_name, token, custom_tuple)
+
+
+# escape only the variable strings, the {line1,line2} schema is fixed
+_esc = json.encoder.encode_basestring_ascii
+
+# fixed manager menu entries, dumped once instead of on every loop pass
+_MENU_HEAD = _dumps([
+	{'line1': '[B]+ Add New Stremio Addon[/B]', 'line2': 'Add an addon by URL'},
+	{'line1': '[B]+ Add Popular Addon[/B]', 'line2': 'Choose from popular addons'}
+])[1:-1]
+_MENU_REMOVE_ALL = _dumps({'line1': '[B]- Remove All Addons[/B]', 'line2': 'Clear all configured Stremio addons'})
+
+
 def stremio_addon_manager():
 	"""Main Stremio addon manager dialog"""
 	addons = get_stremio_addons()
 
+	# pre-warm configured addon manifests so Test Connection hits warm sockets
+	if addons:
+		urls = [a.get('config_url') or a.get('url') for a in addons if a.get('url')]
+		Thread(target=_validate_many, args=(urls,), daemon=True).start()
+
 	while True:
-		# Build menu items
-		items = []
-		items.append({'line1': '[B]+ Add New Stremio Addon[/B]', 'line2': 'Add an addon by URL'})
-		items.append({'line1': '[B]+ Add Popular Addon[/B]', 'line2': 'Choose from popular addons'})
+		# Build menu items, splicing per-addon fragments around the constants
+		fragments = [_MENU_HEAD]
 
 		for addon in addons:
 			name = addon.get('name', 'Unknown')
@@ -230,13 +362,12 @@ def stremio_addon_manager():
 				types.append('Series')
 			type_str = ', '.join(types) if types else 'Unknown'
 			debrid_str = ' [COLOR green][Debrid][/COLOR]' if has_debrid else ''
-			items.append({
-				'line1': f'[B]{name}[/B]{debrid_str}',
-				'line2': f'{type_str} | {url}'
-			})
+			fragments.append('{"line1":%s,"line2":%s}' % (
+				_esc(f'[B]{name}[/B]{debrid_str}'), _esc(f'{type_str} | {url}')
+			))
 
 		if addons:
-			items.append({'line1': '[B]- Remove All Addons[/B]', 'line2': 'Clear all configured Stremio addons'})
+			fragments.append(_MENU_REMOVE_ALL)
 
 		# Create selection list
 		labels = ['+ Add New Stremio Addon', '+ Add Popular Addon'] + [a.get('name', 'Unknown') for a in addons]
@@ -244,7 +375,7 @@ def stremio_addon_manager():
 			labels.append('- Remove All Addons')
 
 		kwargs = {
-			'items': json.dumps(items),
+			'items': '[%s]' % ','.join(fragments),
 			'heading': 'Stremio Addon Manager',
 			'multi_line': 'true'
 		}
@@ -293,10 +424,10 @@ def add_stremio_addon():
 
 	# Check if addon already exists
 	addons = get_stremio_addons()
-	for existing in addons:
-		if existing.get('id') == addon_info.get('id') or existing.get('url') == addon_info.get('url'):
-			ok_dialog(heading='Error', text='This addon is already configured')
-			return
+	ids, urls = get_stremio_addon_index()
+	if addon_info.get('id') in ids or addon_info.get('url') in urls:
+		ok_dialog(heading='Error', text='This addon is already configured')
+		return
 
 	# Ask if user wants to configure debrid
 	enabled_debrids = get_enabled_debrid_services()
@@ -336,7 +467,7 @@ def configure_addon_debrid(addon_info, enabled_debrids):
 	items.append({'line1': '[B]Skip[/B]', 'line2': 'Do not configure debrid'})
 
 	kwargs = {
-		'items': json.dumps(items),
+		'items': _dumps(items),
 		'heading': 'Select Debrid Service',
 		'multi_line': 'true'
 	}
@@ -378,7 +509,7 @@ def manage_single_addon(addon_idx):
 		items.insert(3, {'line1': '[B]Remove Debrid Config[/B]', 'line2': 'Clear debrid configuration'})
 
 	kwargs = {
-		'items': json.dumps(items),
+		'items': _dumps(items),
 		'heading': addon.get('name', 'Unknown'),
 		'multi_line': 'true'
 	}
@@ -443,21 +574,9 @@ def enter_config_url(addon_idx):
 
 	try:
 		# Try to fetch manifest from config URL
-		base_url = url.rstrip('/')
-		if not base_url.startswith(('http://', 'https://')):
-			base_url = 'https://' + base_url
+		base_url, manifest_url = _normalize_manifest_url(url)
 
-		if not base_url.endswith('/manifest.json'):
-			manifest_url = f"{base_url}/manifest.json"
-		else:
-			manifest_url = base_url
-			base_url = base_url[:-14]
-
-		response = requests.get(
-			manifest_url,
-			timeout=10,
-			headers={'User-Agent': 'POV-Kodi/1.0'}
-		)
+		response = _http_get(manifest_url, timeout=10)
 
 		if response.status_code == 200:
 			addon['config_url'] = base_url
@@ -470,18 +589,40 @@ def enter_config_url(addon_idx):
 		ok_dialog(heading='Error', text=f'Failed to validate URL:\n{str(e)}')
 
 
+def _ping_manifest(url):
+	"""Cheap liveness probe, HEAD with a GET fallback for hosts that reject it"""
+	manifest_url = _normalize_manifest_url(url)[1]
+	try:
+		response = _http_head(manifest_url)
+		if response.status_code in (403, 405):
+			response = _http_get(manifest_url, timeout=10)
+		if response.status_code == 304 or 200 <= response.status_code < 300:
+			return True, None
+		return False, 'HTTP %d' % response.status_code
+	except Exception as e:
+		return False, str(e)
+
+
 def test_stremio_addon(addon):
 	"""Test a Stremio addon connection"""
 	notification('Testing addon...', 2000)
 
 	# Test both base URL and config URL if available
 	test_url = addon.get('config_url', '') or addon.get('url', '')
+	config_status = 'with debrid config' if addon.get('config_url') else 'base URL'
+
+	# HEAD answers the common success case without body or JSON decode
+	ok, _ = _ping_manifest(test_url)
+	if ok:
+		ok_dialog(heading='Connection Successful', text=f"'{addon.get('name', 'Addon')}' is working correctly ({config_status})")
+		return
+
+	# full validation only to produce a detailed error message
 	addon_info, error = validate_stremio_addon(test_url)
 
 	if error:
 		ok_dialog(heading='Connection Failed', text=error)
 	else:
-		config_status = 'with debrid config' if addon.get('config_url') else 'base URL'
 		ok_dialog(heading='Connection Successful', text=f"'{addon_info['name']}' is working correctly ({config_status})")
 
 
@@ -490,6 +631,13 @@ def view_addon_details(addon):
 	debrid_status = 'Configured' if addon.get('config_url') else 'Not configured'
 	debrid_service = addon.get('debrid_service', 'None')
 
+	# render once per addon state, reopening the dialog reuses the text
+	aget = addon.get
+	key = hash((aget('name'), aget('id'), aget('version'), aget('url'), aget('config_url'), debrid_service))
+	if addon.get('_details_key') == key:
+		ok_dialog(heading='Addon Details', text=addon['_details_text'])
+		return
+
 	text = (
 		f"[B]Name:[/B] {addon.get('name', 'Unknown')}\n"
 		f"[B]ID:[/B] {addon.get('id', 'N/A')}\n"
@@ -503,6 +651,7 @@ def view_addon_details(addon):
 		f"[B]Debrid Service:[/B] {debrid_service.capitalize() if debrid_service != 'None' else 'None'}\n"
 		f"[B]Description:[/B] {addon.get('description', 'N/A')}"
 	)
+	addon['_details_key'], addon['_details_text'] = key, text
 	ok_dialog(heading='Addon Details', text=text)
 
 
@@ -574,7 +723,7 @@ def add_popular_addon():
 		})
 
 	kwargs = {
-		'items': json.dumps(items),
+		'items': _dumps(items),
 		'heading': 'Popular Stremio Addons',
 		'multi_line': 'true'
 	}
@@ -595,10 +744,9 @@ def add_popular_addon():
 
 	# Check if already exists
 	addons = get_stremio_addons()
-	for existing in addons:
-		if existing.get('id') == addon_info.get('id'):
-			ok_dialog(heading='Error', text='This addon is already configured')
-			return
+	if addon_info.get('id') in get_stremio_addon_index()[0]:
+		ok_dialog(heading='Error', text='This addon is already configured')
+		return
 
 	# If addon supports debrid, ask to configure
 	if selected['debrid_support']:
@@ -633,7 +781,7 @@ def reconfigure_all_addons_debrid():
 	]
 
 	kwargs = {
-		'items': json.dumps(items),
+		'items': _dumps(items),
 		'heading': 'Select Debrid Service',
 		'multi_line': 'true'
 	}
@@ -11,12 +11,32 @@
 import os
 import re
 import requests
+from threading import Thread, get_ident
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from modules.kodi_utils import (
 	get_setting, set_property, get_property, clear_property,
 	translate_path, notification, select_dialog
 )
 import json
 
+# one pooled session, subtitle addons hit the same small set of hosts
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+	pool_connections=16, pool_maxsize=32,
+	max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+_SESSION.headers.update({'User-Agent': 'POV-Kodi/1.0'})
+
+_FN_SANITIZE = re.compile(r'[<>:"/\\|?*]')
+_SUB_EXTS = ('.srt', '.sub', '.ass', '.ssa', '.vtt')
+_MANIFEST_SUFFIX = '/manifest.json'
+_CACHE_DIR_READY = False
+
 
 # Language code mapping (ISO 639-1 to full name)
 LANGUAGE_CODES = {
@@ -58,6 +78,11 @@ LANGUAGE_CODES = {
 }
 
 
+# reverse map for preferred-language matching: full name -> ISO 639-1 code
+_NAME_TO_CODE = {v.lower(): k for k, v in LANGUAGE_CODES.items() if len(k) == 2}
+
+
+@lru_cache(maxsize=256)
 def get_language_name(code):
 	"""Convert language code to full name"""
 	if not code:
@@ -66,14 +91,27 @@ def get_language_name(code):
 	return LANGUAGE_CODES.get(code_lower, code.capitalize())
 
 
+# parsed addon list keyed on the raw setting value, reparse only on change
+_ADDONS_CACHE = {'raw': None, 'list': [], 'has_opensubs': False}
+
+
 def get_stremio_addons_with_subtitles():
 	"""Get list of configured Stremio addons that support subtitles"""
 	try:
-		import ast
 		addons_str = get_setting('stremio.addons', '')
-		if addons_str:
-			addons = ast.literal_eval(addons_str)
-			return [a for a in addons if a.get('supports_subtitles', False)]
+		cache = _ADDONS_CACHE
+		if addons_str != cache['raw']:
+			addons = []
+			if addons_str:
+				try: addons = json.loads(addons_str)
+				except:
+					import ast
+					addons = ast.literal_eval(addons_str)
+			if not isinstance(addons, list): addons = []
+			subs = [a for a in addons if a.get('supports_subtitles', False)]
+			cache['raw'], cache['list'] = addons_str, subs
+			cache['has_opensubs'] = any(a.get('url', '').startswith('https://opensubtitles') for a in subs)
+		return list(cache['list'])
 	except:
 		pass
 	return []
@@ -96,8 +134,8 @@ def fetch_subtitles_from_addon(addon_url, media_type, media_id, video_hash=None,
 	subtitles = []
 	try:
 		base_url = addon_url.rstrip('/')
-		if base_url.endswith('/manifest.json'):
-			base_url = base_url[:-14]
+		if base_url.endswith(_MANIFEST_SUFFIX):
+			base_url = base_url[:-len(_MANIFEST_SUFFIX)]
 
 		# Build subtitle endpoint with optional extra args
 		if video_hash and video_size:
@@ -105,15 +143,22 @@ def fetch_subtitles_from_addon(addon_url, media_type, media_id, video_hash=None,
 		else:
 			endpoint = f"{base_url}/subtitles/{media_type}/{media_id}.json"
 
-		response = requests.get(
-			endpoint,
-			timeout=8,
-			headers={'User-Agent': 'POV-Kodi/1.0'}
-		)
+		# subtitle lists rarely change within a day, serve repeats from cache
+		import hashlib
+		from datetime import timedelta
+		from caches.main_cache import MainCache
+		cache_name = 'stremio_subs_%s' % hashlib.sha1(endpoint.encode('utf-8')).hexdigest()
+		maincache = MainCache()
+		cached = maincache.get(cache_name)
+		if cached is not None:
+			return cached
+
+		response = _SESSION.get(endpoint, timeout=8)
 
 		if response.status_code == 200:
 			data = response.json()
 			subtitles = data.get('subtitles', [])
+			maincache.set(cache_name, subtitles, expiration=timedelta(hours=24))
 	except:
 		pass
 
@@ -139,9 +184,8 @@ def fetch_all_stremio_subtitles(imdb_id, media_type='movie', season=None, episod
 	addons = get_stremio_addons_with_subtitles()
 
 	# Also check for hardcoded OpenSubtitles addon
-	opensubtitles_url = 'https://opensubtitles-v3.strem.io'
-	if not any(a.get('url', '').startswith('https://opensubtitles') for a in addons):
-		addons.append({'url': opensubtitles_url, 'name': 'OpenSubtitles'})
+	if not _ADDONS_CACHE['has_opensubs']:
+		addons.append({'url': 'https://opensubtitles-v3.strem.io', 'name': 'OpenSubtitles'})
 
 	# Build media ID
 	if media_type == 'episode' and season and episode:
@@ -151,22 +195,37 @@ def fetch_all_stremio_subtitles(imdb_id, media_type='movie', season=None, episod
 		stremio_type = 'movie'
 		media_id = imdb_id
 
-	for addon in addons:
-		try:
-			addon_url = addon.get('config_url', '') or addon.get('url', '')
-			addon_name = addon.get('name', 'Unknown')
-
-			subtitles = fetch_subtitles_from_addon(
-				addon_url, stremio_type, media_id, video_hash, video_size
-			)
-
-			for sub in subtitles:
-				sub['addon'] = addon_name
-				all_subtitles.append(sub)
-		except:
-			continue
+	# fan the addon fetches out in parallel, wall time collapses to the
+	# slowest single addon instead of the sum of all of them
+	def _fetch_one(addon):
+		addon_url = addon.get('config_url', '') or addon.get('url', '')
+		return addon.get('name', 'Unknown'), fetch_subtitles_from_addon(
+			addon_url, stremio_type, media_id, video_hash, video_size
+		)
 
-	return all_subtitles
+	# hard 4s deadline, whatever answered by then is what the user sees;
+	# stragglers are abandoned rather than serially waited out
+	executor = ThreadPoolExecutor(max_workers=min(8, len(addons)))
+	futures = [executor.submit(_fetch_one, addon) for addon in addons]
+	done, _ = futures_wait(futures, timeout=4)
+	for future in done:
+		try: addon_name, subtitles = future.result()
+		except: continue
+		for sub in subtitles:
+			sub['addon'] = addon_name
+			all_subtitles.append(sub)
+	executor.shutdown(wait=False)
+
+	# mirrors of the same addon return identical entries, drop repeats
+	seen = set()
+	results = []
+	for sub in all_subtitles:
+		key = (sub.get('lang', ''), sub.get('SubFileName') or sub.get('id') or '', sub.get('url', ''))
+		if key in seen: continue
+		seen.add(key)
+		results.append(sub)
+
+	return results
 
 
 def filter_subtitles_by_language(subtitles, preferred_language=None):
@@ -184,26 +243,27 @@ def filter_subtitles_by_language(subtitles, preferred_language=None):
 		preferred_language = get_setting('subtitles.language', 'English')
 
 	preferred_lower = preferred_language.lower()
-	preferred_subs = []
-	other_subs = []
+	# the real ISO code, 'Portuguese'[:2] is not 'pt'
+	pref_code = _NAME_TO_CODE.get(preferred_lower, preferred_lower[:2])
+	lang_get = LANGUAGE_CODES.get
+	decorated = []
 
 	for sub in subtitles:
 		lang = sub.get('lang', '') or sub.get('SubLanguageID', '') or ''
-		lang_name = get_language_name(lang)
+		lang_lower = lang.lower()
+		lang_name = lang_get(lang_lower, lang.capitalize()) if lang else 'Unknown'
 
 		# Add language name to subtitle object
 		sub['language_name'] = lang_name
 
-		if lang_name.lower() == preferred_lower or lang.lower() == preferred_lower[:2]:
-			preferred_subs.append(sub)
-		else:
-			other_subs.append(sub)
-
-	# Sort by rating if available
-	preferred_subs.sort(key=lambda x: float(x.get('SubRating', 0) or 0), reverse=True)
-	other_subs.sort(key=lambda x: float(x.get('SubRating', 0) or 0), reverse=True)
+		is_pref = lang_name.lower() == preferred_lower or lang_lower == pref_code
+		try: rating = float(sub.get('SubRating') or 0)
+		except: rating = 0.0
+		decorated.append((0 if is_pref else 1, -rating, sub))
 
-	return preferred_subs + other_subs
+	# one sort over (group, -rating) replaces two sorts plus concat
+	decorated.sort(key=lambda t: (t[0], t[1]))
+	return [t[2] for t in decorated]
 
 
 def download_subtitle(subtitle_url, filename=None):
@@ -217,52 +277,82 @@ def download_subtitle(subtitle_url, filename=None):
 	Returns:
 		Path to downloaded subtitle file, or None on failure
 	"""
+	global _CACHE_DIR_READY
+	tmppath = None
 	try:
 		# Create subtitle cache directory
 		cache_dir = translate_path('special://profile/addon_data/plugin.video.pov/subtitles/')
-		if not os.path.exists(cache_dir):
-			os.makedirs(cache_dir)
+		if not _CACHE_DIR_READY:
+			os.makedirs(cache_dir, exist_ok=True)
+			_CACHE_DIR_READY = True
 
 		# Determine filename
 		if not filename:
-			# Extract filename from URL or generate one
-			url_parts = subtitle_url.split('/')
-			filename = url_parts[-1] if url_parts else 'subtitle.srt'
-			# Ensure it has an extension
-			if not any(filename.endswith(ext) for ext in ['.srt', '.sub', '.ass', '.ssa', '.vtt']):
-				filename += '.srt'
+			# content-address by URL so the same file served from several
+			# addons only downloads once
+			import hashlib
+			tail = subtitle_url.rsplit('/', 1)[-1]
+			ext = next((e for e in _SUB_EXTS if tail.endswith(e)), '.srt')
+			filename = hashlib.sha1(subtitle_url.encode('utf-8')).hexdigest() + ext
 
 		# Clean filename
-		filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+		filename = _FN_SANITIZE.sub('_', filename)
 		filepath = os.path.join(cache_dir, filename)
 
+		# already fetched (e.g. by the dialog pre-warm), reuse it
+		if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
+			return filepath
+
 		# Download subtitle
-		response = requests.get(
-			subtitle_url,
-			timeout=15,
-			headers={'User-Agent': 'POV-Kodi/1.0'}
-		)
+		response = _SESSION.get(subtitle_url, timeout=15, stream=True)
 
 		if response.status_code == 200:
-			# Handle gzip encoding if present
-			content = response.content
-
-			# Check if content is gzipped
-			if content[:2] == b'\x1f\x8b':
-				import gzip
-				content = gzip.decompress(content)
-
-			# Write to file
-			with open(filepath, 'wb') as f:
-				f.write(content)
-
+			import shutil
+			raw = response.raw
+			raw.decode_content = True
+			first = raw.read(2)
+
+			# stream into a temp name and rename on success so a dropped
+			# connection never leaves a truncated file at the cached path
+			tmppath = '%s.%d.part' % (filepath, get_ident())
+
+			# gzipped payloads decompress incrementally, everything
+			# streams to disk in 64K chunks either way
+			if first == b'\x1f\x8b':
+				import zlib
+				decomp = zlib.decompressobj(31)
+				with open(tmppath, 'wb') as f:
+					f.write(decomp.decompress(first))
+					while True:
+						chunk = raw.read(65536)
+						if not chunk: break
+						f.write(decomp.decompress(chunk))
+					f.write(decomp.flush())
+			else:
+				with open(tmppath, 'wb') as f:
+					f.write(first)
+					shutil.copyfileobj(raw, f, 65536)
+
+			os.replace(tmppath, filepath)
 			return filepath
 	except Exception as e:
-		pass
+		if tmppath:
+			try: os.remove(tmppath)
+			except: pass
 
 	return None
 
 
+def _prefetch_subtitles(subs):
+	"""Download candidate subtitles in parallel ahead of the user's pick"""
+	urls = [s.get('url', '') for s in subs if s.get('url')]
+	if not urls:
+		return
+	with ThreadPoolExecutor(max_workers=min(5, len(urls))) as executor:
+		for url in urls:
+			executor.submit(download_subtitle, url)
+
+
 def select_subtitle_dialog(subtitles):
 	"""
 	Show a dialog for the user to select a subtitle
@@ -277,25 +367,21 @@ def select_subtitle_dialog(subtitles):
 		notification('No subtitles found', 2000)
 		return None
 
-	items = []
-	for sub in subtitles:
-		lang = sub.get('language_name', get_language_name(sub.get('lang', '')))
-		addon = sub.get('addon', 'Unknown')
+	def _row(sub):
+		lang = sub.get('language_name') or get_language_name(sub.get('lang', ''))
 		rating = sub.get('SubRating', '')
-		rating_str = f" ⭐{rating}" if rating else ''
-
-		# Get subtitle label
 		label = sub.get('SubFileName', '') or sub.get('id', '') or 'Unknown'
 		if len(label) > 50:
 			label = label[:47] + '...'
+		return {
+			'line1': f"[B]{lang}[/B]{f' ⭐{rating}' if rating else ''}",
+			'line2': f"{label} ({sub.get('addon', 'Unknown')})"
+		}
 
-		items.append({
-			'line1': f"[B]{lang}[/B]{rating_str}",
-			'line2': f"{label} ({addon})"
-		})
+	items = [_row(sub) for sub in subtitles]
 
 	kwargs = {
-		'items': json.dumps(items),
+		'items': json.dumps(items, ensure_ascii=False, separators=(',', ':')),
 		'heading': 'Select Subtitle',
 		'multi_line': 'true'
 	}
@@ -381,6 +467,8 @@ def fetch_and_set_subtitle(imdb_id, media_type='movie', season=None, episode=Non
 		# Use first (best match)
 		selected = filtered_subs[0]
 	else:
+		# pre-warm the likely picks while the dialog is up
+		Thread(target=_prefetch_subtitles, args=(filtered_subs[:5],), daemon=True).start()
 		# Show selection dialog
 		selected = select_subtitle_dialog(filtered_subs)
 		if not selected:
@@ -402,14 +490,16 @@ def clear_subtitle_cache():
 	try:
 		cache_dir = translate_path('special://profile/addon_data/plugin.video.pov/subtitles/')
 		if os.path.exists(cache_dir):
+			# one tree walk in C instead of a per-file stat + unlink loop
 			import shutil
-			for filename in os.listdir(cache_dir):
-				filepath = os.path.join(cache_dir, filename)
-				try:
-					if os.path.isfile(filepath):
-						os.unlink(filepath)
-				except:
-					pass
+			shutil.rmtree(cache_dir, ignore_errors=True)
+			os.makedirs(cache_dir, exist_ok=True)
+		# drop the cached subtitle lists along with the downloaded files
+		try:
+			from caches.main_cache import MainCache
+			MainCache().dbcur.execute("DELETE FROM maincache WHERE id LIKE 'stremio_subs_%'")
+		except:
+			pass
 		notification('Subtitle cache cleared', 2000)
 	except Exception as e:
 		notification('Failed to clear subtitle cache', 2000)
@@ -426,7 +516,10 @@ def get_stremio_subtitle_for_player(meta):
 		Path to subtitle file, or None
 	"""
 	try:
-		# Check if Stremio subtitles are enabled
+		# cheapest kill-switches first, before touching meta or anything else
+		sub_action = get_setting('subtitles.subs_action', '2')
+		if sub_action == '2':  # Off
+			return None
 		if get_setting('stremio.subtitles', 'true') != 'true':
 			return None
 
@@ -439,13 +532,8 @@ def get_stremio_subtitle_for_player(meta):
 		season = meta.get('season')
 		episode = meta.get('episode')
 
-		# Determine auto-select based on settings
-		sub_action = get_setting('subtitles.subs_action', '2')
 		auto_select = sub_action == '0'  # Auto mode
 
-		if sub_action == '2':  # Off
-			return None
-
 		return fetch_and_set_subtitle(
 			imdb_id,
 			media_type,